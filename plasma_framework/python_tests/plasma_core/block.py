@@ -7,6 +7,10 @@ from plasma_core.constants import NULL_SIGNATURE
 
 
 class Block(rlp.Serializable):
+    """A child chain block.
+
+    Fields of a block are immutable, so its encoding, hash and Merkle tree are computed once and cached.
+    """
 
     fields = (
         ('transactions', CountableList(Transaction)),
@@ -17,15 +21,22 @@ class Block(rlp.Serializable):
         if transactions is None:
             transactions = []
         super().__init__(transactions, number)
+        self._encoded = None
+        self._hash = None
+        self._merkle = None
 
     @property
     def hash(self):
-        return keccak(self.encoded)
+        if self._hash is None:
+            self._hash = keccak(self.encoded)
+        return self._hash
 
     @property
     def merklized_transaction_set(self):
-        encoded_transactions = [tx.encoded for tx in self.transactions]
-        return FixedMerkle(16, encoded_transactions)
+        if self._merkle is None:
+            encoded_transactions = [tx.encoded for tx in self.transactions]
+            self._merkle = FixedMerkle(16, encoded_transactions)
+        return self._merkle
 
     @property
     def root(self):
@@ -33,7 +44,9 @@ class Block(rlp.Serializable):
 
     @property
     def encoded(self):
-        return rlp.encode(self)
+        if self._encoded is None:
+            self._encoded = rlp.encode(self)
+        return self._encoded
 
     @property
     def is_deposit_block(self):
@@ -47,7 +60,12 @@ class SignedBlock(Block):
 
     def __init__(self, block, signature=NULL_SIGNATURE):
         super().__init__(block.transactions, block.number)
+        # the signed block has the same contents, so whatever the block has computed already holds for it
+        self._encoded = block._encoded
+        self._hash = block._hash
+        self._merkle = block._merkle
         self._signature = signature
+        self._signer = None
 
     @property
     def signature(self):
@@ -55,4 +73,6 @@ class SignedBlock(Block):
 
     @property
     def signer(self):
-        return self._signature.recover_public_key_from_msg_hash(self.hash).to_checksum_address()
+        if self._signer is None:
+            self._signer = self._signature.recover_public_key_from_msg_hash(self.hash).to_checksum_address()
+        return self._signer
@@ -0,0 +1,198 @@
+import mmap
+import os
+import struct
+from collections import OrderedDict
+
+import rlp
+from eth_keys.datatypes import Signature
+from rlp.sedes import big_endian_int
+
+from plasma_core.block import Block, SignedBlock
+from plasma_core.transaction import Transaction
+from plasma_core.utils.rlp_stream import iter_list_items, list_item, list_prefix
+
+
+RECORD_VERSION = 1
+
+
+def encode_block_record(block):
+    """Encodes a block along with its signature as an RLP list of [version, signature, block, transaction signatures].
+
+    An empty signature stands for an unsigned (deposit) block.
+    Signatures of transactions are not a part of the block encoding, so they are kept alongside it.
+    """
+    signature = block.signature if isinstance(block, SignedBlock) else b''
+    tx_signatures = [tx.signatures for tx in block.transactions]
+    payload = rlp.encode(RECORD_VERSION) + rlp.encode(signature) + block.encoded + rlp.encode(tx_signatures)
+    return list_prefix(len(payload)) + payload
+
+
+def decode_block_record(buf, start=0):
+    """Decodes a block record starting at `start` of the buffer, see `encode_block_record`"""
+    (sig_start, sig_end), (block_start, block_end), tx_sig_bounds = _record_items(buf, start)
+    block = rlp.decode(bytes(buf[block_start:block_end]), Block)
+    if tx_sig_bounds is not None:
+        tx_sig_start, tx_sig_end = tx_sig_bounds
+        for tx, tx_signatures in zip(block.transactions, rlp.decode(bytes(buf[tx_sig_start:tx_sig_end]))):
+            tx.signatures = tx_signatures
+    signature = rlp.decode(bytes(buf[sig_start:sig_end]))
+    if signature:
+        return SignedBlock(block, Signature(signature))
+    return block
+
+
+def _record_items(buf, start):
+    """Returns bounds of the signature, block and transaction signatures of a record.
+
+    Records written before the version was added are lists of [signature, block],
+    their transactions are left with empty signatures.
+    """
+    items = list(iter_list_items(buf, start))
+    if len(items) == 2:
+        signature_bounds, block_bounds = items
+        return signature_bounds, block_bounds, None
+
+    (version_start, version_end), signature_bounds, block_bounds, tx_sig_bounds = items
+    version = rlp.decode(bytes(buf[version_start:version_end]), big_endian_int)
+    if version != RECORD_VERSION:
+        raise ValueError('unsupported block record version {}'.format(version))
+    return signature_bounds, block_bounds, tx_sig_bounds
+
+
+class MemoryBlockStore(dict):
+    """Keeps child chain blocks in memory, keyed by block number"""
+
+    def get_transaction(self, blknum, txindex):
+        return self[blknum].transactions[txindex]
+
+
+class FileBlockStore(object):
+    """Keeps child chain blocks on disk, keyed by block number.
+
+    Blocks are appended to segment files as records made by `encode_block_record`.
+    An index file maps every block number to the segment, offset and length of its record.
+
+    Records are read through mmap. `get_transaction` decodes only the requested transaction.
+    The last `max_cached_blocks` blocks stored or read are kept decoded, so that they are not decoded again
+    and the hashes and trees they cache are reused.
+    """
+
+    SEGMENT_NAME = 'segment-{:06d}.dat'
+    INDEX_NAME = 'index.dat'
+    INDEX_ENTRY = struct.Struct('>QIQI')  # blknum, segment, offset, length
+
+    def __init__(self, directory, segment_size=64 * 2 ** 20, max_cached_blocks=64):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_cached_blocks = max_cached_blocks
+        os.makedirs(directory, exist_ok=True)
+
+        self._index = {}
+        self._maps = {}
+        self._blocks = OrderedDict()  # blknum -> decoded block, least recently used first
+        self._load_index()
+        self._segment = max((segment for segment, _, _ in self._index.values()), default=0)
+        self._segment_file = open(self._segment_path(self._segment), 'ab')
+        self._index_file = open(os.path.join(directory, self.INDEX_NAME), 'ab')
+
+    def __contains__(self, blknum):
+        return blknum in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(sorted(self._index))
+
+    def __getitem__(self, blknum):
+        block = self._blocks.get(blknum)
+        if block is None:
+            buf, start, _ = self._record(blknum)
+            block = decode_block_record(buf, start)
+        self._cache_block(blknum, block)
+        return block
+
+    def __setitem__(self, blknum, block):
+        record = encode_block_record(block)
+
+        offset = self._segment_file.tell()
+        if offset and offset + len(record) > self.segment_size:
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_file = open(self._segment_path(self._segment), 'ab')
+            offset = 0
+
+        self._segment_file.write(record)
+        self._segment_file.flush()
+        # the index entry goes last, so that a block is never indexed before it is fully written
+        self._index_file.write(self.INDEX_ENTRY.pack(blknum, self._segment, offset, len(record)))
+        self._index_file.flush()
+        self._index[blknum] = (self._segment, offset, len(record))
+        self._cache_block(blknum, block)
+
+    def get(self, blknum, default=None):
+        return self[blknum] if blknum in self else default
+
+    def get_transaction(self, blknum, txindex):
+        block = self._blocks.get(blknum)
+        if block is not None:
+            return block.transactions[txindex]
+
+        buf, start, _ = self._record(blknum)
+        _, (block_start, _), tx_sig_bounds = _record_items(buf, start)
+        transactions_start, _ = list_item(buf, 0, block_start)
+        tx_start, tx_end = list_item(buf, txindex, transactions_start)
+        tx = Transaction.decode(buf[tx_start:tx_end])
+        if tx_sig_bounds is not None:
+            sig_start, sig_end = list_item(buf, txindex, tx_sig_bounds[0])
+            tx.signatures = rlp.decode(bytes(buf[sig_start:sig_end]))
+        return tx
+
+    def close(self):
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+        self._blocks.clear()
+        self._segment_file.close()
+        self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _load_index(self):
+        path = os.path.join(self.directory, self.INDEX_NAME)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as index_file:
+            data = index_file.read()
+        # a torn last entry means its block was not completely stored
+        usable = len(data) - len(data) % self.INDEX_ENTRY.size
+        if usable < len(data):
+            # drop it, so that new entries are appended at an entry boundary
+            os.truncate(path, usable)
+        for blknum, segment, offset, length in self.INDEX_ENTRY.iter_unpack(data[:usable]):
+            self._index[blknum] = (segment, offset, length)
+
+    def _cache_block(self, blknum, block):
+        self._blocks[blknum] = block
+        self._blocks.move_to_end(blknum)
+        while len(self._blocks) > self.max_cached_blocks:
+            self._blocks.popitem(last=False)
+
+    def _record(self, blknum):
+        segment, offset, length = self._index[blknum]
+        segment_map = self._maps.get(segment)
+        if segment_map is None or len(segment_map) < offset + length:
+            # the segment has grown since it was mapped
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._segment_path(segment), 'rb') as segment_file:
+                segment_map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = segment_map
+        return segment_map, offset, offset + length
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, self.SEGMENT_NAME.format(segment))
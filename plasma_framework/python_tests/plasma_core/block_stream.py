@@ -0,0 +1,98 @@
+"""Reading and writing encoded blocks a transaction at a time.
+
+A block is encoded as an RLP list of [transactions, number]. Decoding it with `rlp.decode` builds all of its
+transactions at once, which for a block of 2 ** 16 transactions takes a lot of memory.
+The helpers here walk the encoding in place instead, see `plasma_core.utils.rlp_stream`.
+"""
+from collections.abc import Sequence
+
+import rlp
+from eth_utils import keccak
+from rlp.sedes import big_endian_int
+
+from plasma_core.transaction import Transaction
+from plasma_core.utils.rlp_stream import item_bounds, iter_list_items, list_prefix
+
+
+class TransactionView(object):
+    """A transaction inside an encoded block, decoded only when its fields are read.
+
+    Only the offsets of the transaction are kept, together with the buffer holding the block.
+    Any attribute of `Transaction` can be read from the view.
+    """
+
+    __slots__ = ('_buf', '_start', '_end', '_hash', '_tx')
+
+    def __init__(self, buf, start, end):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._hash = None
+        self._tx = None
+
+    @property
+    def encoded(self):
+        """Returns a copy of the encoded transaction, taken out of the buffer on every access"""
+        return bytes(self._buf[self._start:self._end])
+
+    @property
+    def hash(self):
+        if self._hash is None:
+            self._hash = keccak(self.encoded)
+        return self._hash
+
+    def decode(self):
+        """Returns the transaction, decoding it on the first call"""
+        if self._tx is None:
+            self._tx = Transaction.decode(self.encoded)
+        return self._tx
+
+    def __getattr__(self, name):
+        return getattr(self.decode(), name)
+
+
+def read_block_number(buf, offset=0):
+    """Returns the number of the block encoded at `offset` of the buffer"""
+    _, (number_start, number_end) = iter_list_items(buf, offset)
+    _, start, end = item_bounds(buf, number_start)
+    return big_endian_int.deserialize(bytes(buf[start:end]))
+
+
+def iter_transactions(buf, offset=0):
+    """Yields a `TransactionView` of every transaction of the block encoded at `offset` of the buffer.
+
+    Nothing is copied out of the buffer, so it can be an mmap of a file holding the block.
+    The buffer has to stay open while any of the views is used.
+    """
+    (transactions_start, _), _ = iter_list_items(buf, offset)
+    for start, end in iter_list_items(buf, transactions_start):
+        yield TransactionView(buf, start, end)
+
+
+def write_block(stream, transactions, number):
+    """Writes the encoding of a block to a file-like object, a transaction at a time.
+
+    Lengths of the encoded transactions are summed up first, as they make the prefix of the list,
+    so `transactions` is iterated twice and has to be a sequence.
+    Each transaction is encoded once, the encodings are cached by `Transaction.encoded`.
+
+    Returns:
+        int: Number of bytes written, the same as `len(Block(transactions, number).encoded)`.
+
+    Raises:
+        TypeError: `transactions` is not a sequence, e.g. a generator which the first pass would use up.
+    """
+    if not isinstance(transactions, Sequence):
+        raise TypeError('transactions must be a sequence, not {}'.format(type(transactions).__name__))
+
+    transactions_length = sum(len(tx.encoded) for tx in transactions)
+    transactions_prefix = list_prefix(transactions_length)
+    encoded_number = rlp.encode(number, big_endian_int)
+
+    block_prefix = list_prefix(len(transactions_prefix) + transactions_length + len(encoded_number))
+    stream.write(block_prefix)
+    stream.write(transactions_prefix)
+    for tx in transactions:
+        stream.write(tx.encoded)
+    stream.write(encoded_number)
+    return len(block_prefix) + len(transactions_prefix) + transactions_length + len(encoded_number)
@@ -1,4 +1,15 @@
-from plasma_core.utils.transactions import decode_utxo_id
+import os
+from collections import OrderedDict
+
+import rlp
+from rlp.sedes import big_endian_int, Binary, CountableList, List
+
+from plasma_core.block_store import MemoryBlockStore, decode_block_record, encode_block_record
+from plasma_core.pending_blocks import PendingBlocks
+from plasma_core.transaction import TransactionOutput
+from plasma_core.utils.signatures import recover_signer
+from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
+from plasma_core.utxo_set import UtxoSet
 from plasma_core.constants import NULL_SIGNATURE, CHILD_BLOCK_INTERVAL
 from plasma_core.exceptions import (InvalidBlockSignatureException,
                                     InvalidTxSignatureException,
@@ -6,56 +17,95 @@ from plasma_core.exceptions import (InvalidBlockSignatureException,
                                     TxAmountMismatchException)
 
 
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SEDES = List([
+    big_endian_int,  # version
+    big_endian_int,  # next child block
+    big_endian_int,  # next deposit block
+    CountableList(List([big_endian_int, TransactionOutput])),  # unspent outputs by utxo position
+    CountableList(Binary()),  # blocks waiting for their parents, see `encode_block_record`
+])
+
+
 class ChildChain(object):
 
-    def __init__(self, operator):
+    def __init__(self, operator, verifying_contract=None, executor=None, block_store=None, max_pending_blocks=1000,
+                 max_cached_signers=2 ** 18):
+        """
+        Args:
+            operator (EthereumAccount): Account expected to sign the child blocks.
+            verifying_contract (Contract): Contract transactions are signed for, see `Transaction.sign`.
+            executor (concurrent.futures.Executor): Optional pool to recover transaction signers with.
+            block_store (MemoryBlockStore OR FileBlockStore): Where blocks are kept, in memory by default.
+            max_pending_blocks (int): How many blocks received ahead of the head are kept until they can be added.
+            max_cached_signers (int): How many recovered input signers are kept, see `recover_signers`.
+        """
         self.operator = operator
-        self.blocks = {}
-        self.parent_queue = {}
+        self.verifying_contract = verifying_contract
+        self.executor = executor
+        self.blocks = block_store if block_store is not None else MemoryBlockStore()
+        self.utxos = UtxoSet()
+        self.pending_blocks = PendingBlocks(max_pending_blocks)
         self.child_block_interval = CHILD_BLOCK_INTERVAL
         self.next_child_block = self.child_block_interval
         self.next_deposit_block = 1
+        self.max_cached_signers = max_cached_signers
+        self._signers = OrderedDict()  # (tx hash, input index) -> (signature, signer), least recently used first
 
     def add_block(self, block):
         # Is the block being added to the head?
-        is_next_child_block = block.number == self.next_child_block
-        if is_next_child_block or block.number == self.next_deposit_block:
-            # Validate the block.
-            try:
-                self._validate_block(block)
-            except (InvalidBlockSignatureException, InvalidTxSignatureException, TxAlreadySpentException, TxAmountMismatchException):
+        if block.number == self.next_child_block or block.number == self.next_deposit_block:
+            if not self.__add_head_block(block):
                 return False
-
-            # Insert the block into the chain.
-            self.__apply_block(block)
-
-            # Update the head state.
-            if is_next_child_block:
-                self.next_deposit_block = self.next_child_block + 1
-                self.next_child_block += self.child_block_interval
-            else:
-                self.next_deposit_block += 1
         # Or does the block not yet have a parent?
         elif block.number > self.next_deposit_block:
-            parent_block_number = block.number - 1
-            if parent_block_number not in self.parent_queue:
-                self.parent_queue[parent_block_number] = []
-            self.parent_queue[parent_block_number].append(block)
+            self.pending_blocks.add(block)
             return False
         # Block already exists.
         else:
             return False
 
         # Process any blocks that were waiting for this block.
-        if block.number in self.parent_queue:
-            for blk in self.parent_queue[block.number]:
-                self.add_block(blk)
-            del self.parent_queue[block.number]
+        self.__add_pending_blocks()
         return True
 
+    def __add_head_block(self, block):
+        # Validate the block and insert it into the chain. Signers of its inputs are not needed afterwards.
+        try:
+            spent = self._validate_block(block)
+            self.__apply_block(block, spent)
+        except (InvalidBlockSignatureException, InvalidTxSignatureException, TxAlreadySpentException, TxAmountMismatchException):
+            return False
+        finally:
+            self.forget_signers(block.transactions)
+
+        # Update the head state.
+        if block.number == self.next_child_block:
+            self.next_deposit_block = self.next_child_block + 1
+            self.next_child_block += self.child_block_interval
+        else:
+            self.next_deposit_block += 1
+        return True
+
+    def __add_pending_blocks(self):
+        # Deposit blocks go first, as a child block puts all the remaining deposit numbers of its interval behind the head.
+        while True:
+            self.pending_blocks.drop_below(self.next_deposit_block)
+            block = self.pending_blocks.pop(self.next_deposit_block) or self.pending_blocks.pop(self.next_child_block)
+            if block is None:
+                return
+            self.__add_head_block(block)
+
     def validate_transaction(self, tx, temp_spent=None):
-        if not temp_spent:
-            temp_spent = dict()
+        """Validates a transaction against the UTXO set.
+
+        Args:
+            tx (Transaction): Transaction to validate.
+            temp_spent (set): Utxo positions consumed by earlier transactions of the same block.
+                Inputs of the transaction are added to it, so that a following transaction can not spend them again.
+        """
+        if temp_spent is None:
+            temp_spent = set()
 
         input_amount = 0
         output_amount = sum([o.amount for o in tx.outputs])
@@ -67,48 +117,149 @@ class ChildChain(object):
             if i.blknum == 0:
                 continue
 
-            input_tx = self.get_transaction(i.identifier)
+            # Check to see if the input is already spent.
+            spent_output = self.utxos.get(i.identifier)
+            if spent_output is None or i.identifier in temp_spent:
+                raise TxAlreadySpentException('failed to validate tx')
 
             # Check for a valid signature.
-            output_guard = input_tx.outputs[i.oindex].output_guard
-            if tx.signatures[x] == NULL_SIGNATURE or tx.signers[x] != output_guard:
+            if tx.signatures[x] == NULL_SIGNATURE or self.get_signer(tx, x) != spent_output.output_guard:
                 raise InvalidTxSignatureException('failed to validate tx')
-
-            # Check to see if the input is already spent.
-            if input_tx.spent[i.oindex] or i.identifier in temp_spent:
-                raise TxAlreadySpentException('failed to validate tx')
-            input_amount += input_tx.outputs[i.oindex].amount
+            input_amount += spent_output.amount
+            temp_spent.add(i.identifier)
 
         if not tx.is_deposit and input_amount < output_amount:
             raise TxAmountMismatchException('failed to validate tx')
 
+    def get_signer(self, tx, index):
+        """Returns the signer of a transaction's input, as recovered from its signature"""
+        key = (tx.hash, index)
+        signature, signer = self._signers.get(key, (None, None))
+        if signature != tx.signatures[index]:
+            self.recover_signers([tx])
+            signature, signer = self._signers[key]
+        else:
+            self._signers.move_to_end(key)
+        return signer
+
+    def recover_signers(self, txs):
+        """Recovers signers of all inputs of the transactions, in parallel if the chain has an executor.
+
+        Signers are cached per (tx hash, input index) together with the signature they were recovered from.
+        Once there are more than `max_cached_signers` of them, the least recently used are dropped.
+        """
+        keys, msg_hashes, signatures = [], [], []
+        for tx in txs:
+            for index, signature in enumerate(tx.signatures):
+                cached_signature, _ = self._signers.get((tx.hash, index), (None, None))
+                if signature == cached_signature:
+                    continue
+                keys.append((tx.hash, index))
+                msg_hashes.append(tx.hash_struct(verifying_contract=self.verifying_contract))
+                signatures.append(signature)
+
+        if self.executor is None or len(keys) < 2:
+            signers = map(recover_signer, msg_hashes, signatures)
+        else:
+            signers = self.executor.map(recover_signer, msg_hashes, signatures, chunksize=max(1, len(keys) // 64))
+
+        for key, signature, signer in zip(keys, signatures, signers):
+            self._signers[key] = (signature, signer)
+            self._signers.move_to_end(key)
+        while len(self._signers) > self.max_cached_signers:
+            self._signers.popitem(last=False)
+
+    def forget_signers(self, txs):
+        """Drops cached signers of all inputs of the transactions"""
+        for tx in txs:
+            for index in range(len(tx.signatures)):
+                self._signers.pop((tx.hash, index), None)
+
     def get_block(self, blknum):
         return self.blocks[blknum]
 
     def get_transaction(self, transaction_id):
         (blknum, txindex, _) = decode_utxo_id(transaction_id)
-        return self.blocks[blknum].transactions[txindex]
+        return self.blocks.get_transaction(blknum, txindex)
+
+    def is_spent(self, utxo_pos):
+        """Tells whether an existing output has been spent"""
+        (blknum, txindex, oindex) = decode_utxo_id(utxo_pos)
+        if oindex >= len(self.blocks.get_transaction(blknum, txindex).outputs):
+            raise KeyError(utxo_pos)
+        return utxo_pos not in self.utxos
+
+    def save_snapshot(self, path):
+        """Writes the UTXO set, head counters and blocks waiting for their parents to a file.
+
+        Blocks themselves are not a part of the snapshot, they are expected to be kept in a persistent block store.
+        """
+        pending_blocks = [encode_block_record(block) for block in self.pending_blocks]
+        snapshot = [
+            SNAPSHOT_VERSION,
+            self.next_child_block,
+            self.next_deposit_block,
+            sorted(self.utxos.utxos.items()),
+            pending_blocks
+        ]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as snapshot_file:
+            snapshot_file.write(rlp.encode(snapshot, SNAPSHOT_SEDES))
+        os.replace(tmp_path, path)
+
+    def load_snapshot(self, path):
+        """Restores the state saved by `save_snapshot` into a fresh chain.
+
+        Blocks following the snapshot can then be replayed with `add_block`.
+        """
+        with open(path, 'rb') as snapshot_file:
+            snapshot = rlp.decode(snapshot_file.read(), SNAPSHOT_SEDES)
+        version, next_child_block, next_deposit_block, utxos, pending_blocks = snapshot
+        if version != SNAPSHOT_VERSION:
+            raise ValueError('unsupported snapshot version {}'.format(version))
+
+        self.next_child_block = next_child_block
+        self.next_deposit_block = next_deposit_block
+        for utxo_pos, output in utxos:
+            self.utxos.add(utxo_pos, output)
+        for record in pending_blocks:
+            self.add_block(decode_block_record(record))
 
     def get_current_block_num(self):
         return self.next_child_block
 
-    def __apply_transaction(self, tx):
-        for i in tx.inputs:
-            if i.blknum == 0:
-                continue
-            input_tx = self.get_transaction(i.identifier)
-            input_tx.spent[i.oindex] = True
+    def force_add_block(self, block):
+        """Puts a child block at the head without validating it.
+
+        Models an operator publishing an invalid block: outputs of the block become spendable,
+        but outputs it spends are left unspent.
+        """
+        self.__apply_block(block, spent=())
+        self.next_deposit_block = self.next_child_block + 1
+        self.next_child_block += self.child_block_interval
 
     def _validate_block(self, block):
+        """Validates a block, returning utxo positions its transactions consume"""
         # Check for a valid signature.
         if not block.is_deposit_block and (block.signature == NULL_SIGNATURE or block.signer != self.operator.address):
             raise InvalidBlockSignatureException('failed to validate block')
 
-        # Validate each transaction in the block.
-        for tx in block.transactions:
-            self.validate_transaction(tx)
+        # Recover signers of all inputs up front, so that it can be done in parallel.
+        self.recover_signers(block.transactions)
 
-    def __apply_block(self, block):
+        # Validate each transaction in the block, rejecting outputs spent twice within the block.
+        spent = set()
         for tx in block.transactions:
-            self.__apply_transaction(tx)
-        self.blocks[block.number] = block
+            self.validate_transaction(tx, spent)
+        return spent
+
+    def __apply_block(self, block, spent):
+        created = [(encode_utxo_id(block.number, txindex, oindex), output)
+                   for txindex, tx in enumerate(block.transactions)
+                   for oindex, output in enumerate(tx.outputs)]
+        removed = self.utxos.apply(spent, created)
+        try:
+            self.blocks[block.number] = block
+        except Exception:
+            self.utxos.apply([utxo_pos for utxo_pos, _ in created], removed)
+            raise
@@ -16,3 +16,7 @@ class TxAmountMismatchException(Exception):
 
 class InvalidBlockMerkleException(Exception):
     """merkle tree of a block is invalid"""
+
+
+class DepositTxException(Exception):
+    """deposit transactions can only be made on the root chain"""
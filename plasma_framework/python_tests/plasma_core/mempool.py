@@ -0,0 +1,177 @@
+import time
+from collections import OrderedDict
+
+from plasma_core.block import Block
+from plasma_core.exceptions import DepositTxException, TxAlreadySpentException
+from plasma_core.utils.merkle.incremental_merkle import IncrementalMerkle
+
+BLOCK_DEPTH = 16
+MAX_BLOCK_SIZE = 2 ** BLOCK_DEPTH
+
+
+class Mempool(object):
+    """Signed transactions waiting to be included in a child block, and the builder of those blocks.
+
+    Transactions are validated against the UTXO set of the chain plus outputs spent by transactions already in the pool
+    or in blocks cut from it, and are put into blocks in order of arrival.
+    The Merkle root of the next block is kept up to date as they arrive.
+    """
+
+    def __init__(self, child_chain, max_block_size=MAX_BLOCK_SIZE, max_block_age=None, clock=time.monotonic):
+        """
+        Args:
+            child_chain (ChildChain): Chain the transactions are validated against and blocks are built for.
+            max_block_size (int): Number of transactions that makes a block ready, at most 2 ** 16.
+            max_block_age (float): Seconds after which a block is ready, counted from its oldest transaction.
+            clock (callable): Source of time for `max_block_age`.
+        """
+        if not 0 < max_block_size <= MAX_BLOCK_SIZE:
+            raise ValueError('max_block_size must be between 1 and {}'.format(MAX_BLOCK_SIZE))
+
+        self.child_chain = child_chain
+        self.max_block_size = max_block_size
+        self.max_block_age = max_block_age
+        self.clock = clock
+
+        self._txs = OrderedDict()  # tx hash -> (tx, time added)
+        self._spent = {}  # utxo position -> hash of the pool or cut tx spending it
+        self._cut_blocks = {}  # block number -> (tx, time added) of blocks cut but not yet confirmed or abandoned
+        self._merkle = IncrementalMerkle(BLOCK_DEPTH)
+
+    def __len__(self):
+        return len(self._txs)
+
+    def __contains__(self, tx_hash):
+        return tx_hash in self._txs
+
+    @property
+    def next_block_root(self):
+        """Merkle root of the block `cut_block` would make right now"""
+        return self._merkle.root
+
+    def add(self, tx):
+        """Validates a transaction and puts it into the pool.
+
+        Raises:
+            TxAlreadySpentException: An input is spent, or is being spent by a transaction in the pool.
+            InvalidTxSignatureException, TxAmountMismatchException: See `ChildChain.validate_transaction`.
+            DepositTxException: The transaction has no inputs.
+        """
+        if tx.is_deposit:
+            raise DepositTxException('failed to validate tx')
+
+        spent = set()
+        self.child_chain.validate_transaction(tx, spent)
+        if any(utxo_pos in self._spent for utxo_pos in spent):
+            raise TxAlreadySpentException('failed to validate tx')
+
+        for utxo_pos in spent:
+            self._spent[utxo_pos] = tx.hash
+        self._txs[tx.hash] = (tx, self.clock())
+        if self._merkle.member_count < self.max_block_size:
+            self._merkle.append(tx.encoded)
+
+    def remove(self, tx_hash):
+        """Drops a transaction from the pool, returning it"""
+        tx, _ = self._txs.pop(tx_hash)
+        self.__release_inputs(tx)
+        self.__rebuild_merkle()
+        return tx
+
+    def evict_spent(self):
+        """Drops transactions whose inputs got spent on the chain, e.g. by a block built elsewhere.
+
+        This is done by `cut_block`, `confirm_block` and `abandon_block` already.
+
+        Returns:
+            list: Hashes of the dropped transactions.
+        """
+        conflicting = {tx_hash for utxo_pos, tx_hash in self._spent.items()
+                       if tx_hash in self._txs and utxo_pos not in self.child_chain.utxos}
+        for tx_hash in conflicting:
+            tx, _ = self._txs.pop(tx_hash)
+            self.__release_inputs(tx)
+        if conflicting:
+            self.__rebuild_merkle()
+        return list(conflicting)
+
+    def is_block_ready(self):
+        """Tells whether there are enough transactions for a block, or the oldest of them waits long enough"""
+        if not self._txs:
+            return False
+        if len(self._txs) >= self.max_block_size:
+            return True
+        if self.max_block_age is None:
+            return False
+        _, oldest_time = next(iter(self._txs.values()))
+        return self.clock() - oldest_time >= self.max_block_age
+
+    def cut_block(self):
+        """Takes the oldest transactions out of the pool, up to `max_block_size` of them, as the next child block.
+
+        The block still has to be signed by the operator and added to the chain, see `submit_block`.
+        Until then its inputs stay reserved, so no transaction spending them again is accepted.
+        Once the chain has taken or rejected the block, pass it to `confirm_block` or `abandon_block`.
+        Blocks can be cut ahead of those already waiting, they are numbered one after another.
+        """
+        self.evict_spent()
+        entries = []
+        while self._txs and len(entries) < self.max_block_size:
+            _, entry = self._txs.popitem(last=False)
+            entries.append(entry)
+        number = self.child_chain.next_child_block + self.child_chain.child_block_interval * len(self._cut_blocks)
+        block = Block([tx for tx, _ in entries], number=number)
+        self._cut_blocks[number] = entries
+        self.__rebuild_merkle()
+        return block
+
+    def confirm_block(self, block):
+        """Releases inputs of a cut block which the chain has added, and drops transactions conflicting with it"""
+        for tx, _ in self._cut_blocks.pop(block.number):
+            self.__release_inputs(tx)
+        return self.evict_spent()
+
+    def abandon_block(self, block):
+        """Puts transactions of a cut block which the chain has rejected back into the pool, ahead of the rest.
+
+        Blocks cut after it are abandoned too, as their numbers follow its number.
+        Transactions whose inputs got spent on the chain meanwhile are dropped.
+        """
+        numbers = sorted(number for number in self._cut_blocks if number >= block.number)
+        for number in reversed(numbers):
+            for tx, added in reversed(self._cut_blocks.pop(number)):
+                self._txs[tx.hash] = (tx, added)
+                self._txs.move_to_end(tx.hash, last=False)
+        self.__rebuild_merkle()
+        return self.evict_spent()
+
+    def submit_block(self, key):
+        """Cuts the next block, signs it with the operator key and adds it to the chain.
+
+        Returns:
+            SignedBlock: The added block, or None if the chain rejected it.
+        """
+        signed_block = self.cut_block().sign(key)
+        if self.child_chain.add_block(signed_block):
+            self.confirm_block(signed_block)
+            return signed_block
+        self.abandon_block(signed_block)
+        return None
+
+    def poll(self):
+        """Returns the next block if it is ready, None otherwise"""
+        if self.is_block_ready():
+            return self.cut_block()
+        return None
+
+    def __release_inputs(self, tx):
+        for i in tx.inputs:
+            if i.blknum != 0:
+                del self._spent[i.identifier]
+
+    def __rebuild_merkle(self):
+        self._merkle = IncrementalMerkle(BLOCK_DEPTH)
+        for tx, _ in self._txs.values():
+            if self._merkle.member_count >= self.max_block_size:
+                break
+            self._merkle.append(tx.encoded)
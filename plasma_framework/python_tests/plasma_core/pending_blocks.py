@@ -0,0 +1,60 @@
+import heapq
+
+
+class PendingBlocks(object):
+    """Blocks received ahead of the chain head, waiting until they can be added.
+
+    Blocks are ordered by number in a heap, so stale ones are dropped cheaply from its top.
+    At most `max_size` blocks are kept: when full, the block furthest from the head is evicted.
+    """
+
+    def __init__(self, max_size=1000):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+
+        self.max_size = max_size
+        self._numbers = []  # heap of the block numbers in `_blocks`
+        self._blocks = {}  # block number -> candidate blocks in order of arrival, emptied lists stay until dropped
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, number):
+        return bool(self._blocks.get(number))
+
+    def __iter__(self):
+        for number in sorted(self._blocks):
+            yield from self._blocks[number]
+
+    def add(self, block):
+        """Buffers a block. Returns False if it was not kept, because the buffer is full of closer blocks"""
+        if self._size >= self.max_size:
+            furthest = max(number for number, candidates in self._blocks.items() if candidates)
+            if block.number >= furthest:
+                return False
+            self._remove_one(furthest)
+
+        if block.number not in self._blocks:
+            self._blocks[block.number] = []
+            heapq.heappush(self._numbers, block.number)
+        self._blocks[block.number].append(block)
+        self._size += 1
+        return True
+
+    def pop(self, number):
+        """Removes and returns the earliest received block of the number, or None if there is none"""
+        if number not in self:
+            return None
+        return self._remove_one(number, last=False)
+
+    def drop_below(self, number):
+        """Drops all blocks numbered lower than `number`"""
+        while self._numbers and self._numbers[0] < number:
+            stale = heapq.heappop(self._numbers)
+            self._size -= len(self._blocks.pop(stale))
+
+    def _remove_one(self, number, last=True):
+        candidates = self._blocks[number]
+        self._size -= 1
+        return candidates.pop() if last else candidates.pop(0)
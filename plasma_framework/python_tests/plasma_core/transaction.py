@@ -1,4 +1,5 @@
 import enum
+from collections import namedtuple
 
 import rlp
 from eth_utils import address, keccak
@@ -6,7 +7,8 @@ from rlp.sedes import big_endian_int, CountableList, Binary
 
 from plasma_core.constants import NULL_SIGNATURE, NULL_ADDRESS, EMPTY_METADATA
 from plasma_core.utils.eip712_struct_hash import hash_struct
-from plasma_core.utils.transactions import encode_utxo_id
+from plasma_core.utils.signatures import sign_msg_hash, sign_msg_hash_with_raw_key
+from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
 
 
 class TxTypes(enum.Enum):
@@ -18,38 +20,91 @@ class TxOutputTypes(enum.Enum):
 
 
 class TransactionInput:
+    """Position of the output being spent.
+
+    Only the packed position is kept. An input decoded from RLP keeps the original 32 bytes of utxo_id instead,
+    and blknum, txindex and oindex are decoded from them on access.
+    """
+
+    __slots__ = ('_identifier', '_utxo_id')
+
     def __init__(self, blknum=0, txindex=0, oindex=0):
-        self.blknum = blknum
-        self.txindex = txindex
-        self.oindex = oindex
+        self._identifier = encode_utxo_id(blknum, txindex, oindex)
+        self._utxo_id = None
+
+    @classmethod
+    def from_utxo_id(cls, utxo_id):
+        tx_input = cls.__new__(cls)
+        tx_input._identifier = None
+        tx_input._utxo_id = utxo_id
+        return tx_input
+
+    @property
+    def blknum(self):
+        return decode_utxo_id(self.identifier)[0]
+
+    @property
+    def txindex(self):
+        return decode_utxo_id(self.identifier)[1]
+
+    @property
+    def oindex(self):
+        return decode_utxo_id(self.identifier)[2]
 
     @property
     def utxo_id(self):
-        return self.identifier.to_bytes(32, 'big')
+        if self._utxo_id is None:
+            return self._identifier.to_bytes(32, 'big')
+        return self._utxo_id
 
     @property
     def identifier(self):
-        return encode_utxo_id(self.blknum, self.txindex, self.oindex)
+        if self._identifier is None:
+            return int.from_bytes(self._utxo_id, 'big')
+        return self._identifier
 
+    def __eq__(self, other):
+        return isinstance(other, TransactionInput) and self.identifier == other.identifier
 
-class TransactionOutput(rlp.Serializable):
-    fields = (
-        ('output_type', rlp.sedes.big_endian_int),
-        ('output_guard', rlp.sedes.Binary.fixed_length(20)),
-        ('token', rlp.sedes.Binary.fixed_length(20)),
-        ('amount', big_endian_int)
-    )
+    def __hash__(self):
+        return hash(self.identifier)
 
-    def __init__(self,
-                 output_guard=NULL_ADDRESS,
-                 token=NULL_ADDRESS,
-                 amount=0,
-                 output_type=TxOutputTypes.PAYMENT.value):
 
-        output_guard = address.to_canonical_address(output_guard)
-        token = address.to_canonical_address(token)
-        amount = amount
-        super().__init__(output_type, output_guard, token, amount)
+class TransactionOutput(namedtuple('TransactionOutput', ('output_type', 'output_guard', 'token', 'amount'))):
+    """Output of a transaction, a plain tuple that also serves as its own RLP sedes"""
+
+    __slots__ = ()
+
+    _sedes = rlp.sedes.List((big_endian_int, Binary.fixed_length(20), Binary.fixed_length(20), big_endian_int))
+
+    def __new__(cls,
+                output_guard=NULL_ADDRESS,
+                token=NULL_ADDRESS,
+                amount=0,
+                output_type=TxOutputTypes.PAYMENT.value):
+
+        output_guard = _to_canonical_address(output_guard)
+        token = _to_canonical_address(token)
+        return super().__new__(cls, output_type, output_guard, token, amount)
+
+    def __getnewargs__(self):
+        # arguments of `__new__` are not in field order, which pickle and copy would otherwise pass
+        return (self.output_guard, self.token, self.amount, self.output_type)
+
+    @classmethod
+    def serialize(cls, obj):
+        return cls._sedes.serialize(obj)
+
+    @classmethod
+    def deserialize(cls, serial):
+        # decoded addresses are canonical already
+        return cls._make(cls._sedes.deserialize(serial))
+
+
+def _to_canonical_address(value):
+    if isinstance(value, bytes) and len(value) == 20:
+        return value
+    return address.to_canonical_address(value)
 
 
 class Transaction(rlp.Serializable):
@@ -83,18 +138,25 @@ class Transaction(rlp.Serializable):
         if signers is None:
             signers = [NULL_ADDRESS] * len(inputs)
 
-        inputs = [TransactionInput(*i) for i in inputs]
-        outputs = [TransactionOutput(*o) for o in outputs]
+        inputs = [i if isinstance(i, TransactionInput) else TransactionInput(*i) for i in inputs]
+        outputs = [o if isinstance(o, TransactionOutput) else TransactionOutput(*o) for o in outputs]
 
         super().__init__(tx_type.value, inputs, outputs, metadata)
 
         self.signatures = signatures[:]
         self._signers = signers[:]
-        self.spent = [False] * len(outputs)
+
+        # Fields of a transaction are immutable and signatures are not a part of its encoding,
+        # so none of these needs to be invalidated once computed.
+        self._encoded = None
+        self._hash = None
+        self._struct_hashes = {}
 
     @property
     def hash(self):
-        return keccak(self.encoded)
+        if self._hash is None:
+            self._hash = keccak(self.encoded)
+        return self._hash
 
     @property
     def signers(self):
@@ -102,16 +164,33 @@ class Transaction(rlp.Serializable):
 
     @property
     def encoded(self):
-        return rlp.encode(self)
+        if self._encoded is None:
+            self._encoded = rlp.encode(self)
+        return self._encoded
 
     @property
     def is_deposit(self):
         return all([i.blknum == 0 for i in self.inputs])
 
     @classmethod
-    def serialize(cls, obj):
-        sedes_list = [field_sedes for field, field_sedes in cls._meta.fields]
+    def decode(cls, encoded):
+        """Decodes a transaction, keeping the given bytes as its encoding"""
+        tx = rlp.decode(encoded, cls)
+        tx._encoded = bytes(encoded)
+        return tx
 
+    @classmethod
+    def deserialize(cls, serial):
+        tx_type, utxo_ids, outputs, metadata = cls._sedes().deserialize(serial)
+        inputs = [TransactionInput.from_utxo_id(utxo_id) for utxo_id in utxo_ids]
+        return cls(TxTypes(tx_type), inputs, outputs, metadata)
+
+    @classmethod
+    def _sedes(cls):
+        return rlp.sedes.List([field_sedes for field, field_sedes in cls._meta.fields])
+
+    @classmethod
+    def serialize(cls, obj):
         tx_elems = [
             obj.tx_type,
             [i.utxo_id for i in obj.inputs],
@@ -119,23 +198,54 @@ class Transaction(rlp.Serializable):
             obj.metadata
         ]
 
-        tx_sedes = rlp.sedes.List(sedes_list)
-        return tx_sedes.serialize(tx_elems)
+        return cls._sedes().serialize(tx_elems)
+
+    def hash_struct(self, verifying_contract=None):
+        """EIP-712 hash of the transaction, which is what the inputs' owners sign"""
+        verifying_address = verifying_contract.address if verifying_contract else None
+        struct_hash = self._struct_hashes.get(verifying_address)
+        if struct_hash is None:
+            struct_hash = hash_struct(self, verifying_contract=verifying_contract)
+            self._struct_hashes[verifying_address] = struct_hash
+        return struct_hash
 
     def sign(self, index, account, verifying_contract=None):
-        msg_hash = hash_struct(self, verifying_contract=verifying_contract)
-        sig = account.key.sign_msg_hash(msg_hash)
-        self.signatures[index] = _amend_signature(sig.to_bytes())
-        self._signers[index] = sig.recover_public_key_from_msg_hash(
-            msg_hash).to_canonical_address() if sig != NULL_SIGNATURE else NULL_ADDRESS
+        msg_hash = self.hash_struct(verifying_contract=verifying_contract)
+        self.signatures[index] = sign_msg_hash(account.key, msg_hash)
+        # the signer is the owner of the signing key, there is no need to recover it from the signature
+        self._signers[index] = account.key.public_key.to_canonical_address()
+
+
+def sign_many(txs, accounts, verifying_contract=None, executor=None):
+    """Signs all inputs of many transactions.
 
+    The signing hash of every transaction is computed once and reused for all of its inputs.
 
-def _amend_signature(sig):
-    """ We are making it in order to make signatures produced by eth_keys library
-        compatible with openzellelin ECDSA public key recovery.
+    Args:
+        txs (Transaction[]): Transactions to sign.
+        accounts (EthereumAccount[][]): For every transaction, accounts signing its consecutive inputs.
+        verifying_contract (Contract): Contract the signatures are meant for.
+        executor (concurrent.futures.Executor): Optional pool to fan the signing out to.
 
-        Please note:
-        https://github.com/OpenZeppelin/openzeppelin-contracts/blob/c3f2ed81683bd0095673f525f7ee9639370a2432/contracts/cryptography/ECDSA.sol#L53
+    Returns:
+        Transaction[]: The signed transactions.
     """
-    sig_int = int.from_bytes(sig, 'big')
-    return (sig_int + 27).to_bytes(len(sig), 'big')
+    if len(txs) != len(accounts):
+        raise ValueError('every transaction needs its list of signing accounts')
+
+    jobs = []
+    for tx, tx_accounts in zip(txs, accounts):
+        msg_hash = tx.hash_struct(verifying_contract=verifying_contract)
+        jobs.extend((account.key.to_bytes(), msg_hash) for account in tx_accounts)
+
+    if executor is None:
+        signatures = map(sign_msg_hash_with_raw_key, jobs)
+    else:
+        signatures = executor.map(sign_msg_hash_with_raw_key, jobs, chunksize=max(1, len(jobs) // 64))
+
+    signatures = iter(signatures)
+    for tx, tx_accounts in zip(txs, accounts):
+        for index, account in enumerate(tx_accounts):
+            tx.signatures[index] = next(signatures)
+            tx._signers[index] = account.key.public_key.to_canonical_address()
+    return txs
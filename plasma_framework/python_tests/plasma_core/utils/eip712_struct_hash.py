@@ -1,80 +1,84 @@
-from eip712_structs import EIP712Struct, Address, Uint, Bytes, make_domain
+from functools import lru_cache
+
+from eip712_structs import make_domain
 from plasma_core.constants import NULL_ADDRESS
-from eth_utils import keccak
+from eth_hash.auto import keccak
 from plasma_core.utils.utils import hex_to_binary
 
+DOMAIN_NAME = 'OMG Network'
+DOMAIN_VERSION = '1'
+DOMAIN_SALT = hex_to_binary('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83')
+
+# Type encodings as defined by EIP-712, referenced struct types are appended in alphabetical order
+INPUT_TYPE = 'Input(uint256 blknum,uint256 txindex,uint256 oindex)'
+OUTPUT_TYPE = 'Output(uint256 outputType,bytes20 outputGuard,address currency,uint256 amount)'
+TRANSACTION_TYPE = ('Transaction(uint256 txType,'
+                    'Input input0,Input input1,Input input2,Input input3,'
+                    'Output output0,Output output1,Output output2,Output output3,'
+                    'bytes32 metadata)' + INPUT_TYPE + OUTPUT_TYPE)
+
+INPUT_TYPE_HASH = keccak(INPUT_TYPE.encode())
+OUTPUT_TYPE_HASH = keccak(OUTPUT_TYPE.encode())
+TRANSACTION_TYPE_HASH = keccak(TRANSACTION_TYPE.encode())
+
+NUM_TXOS = 4
+ZERO_WORD = b'\x00' * 32
+EMPTY_INPUT_HASH = keccak(INPUT_TYPE_HASH + ZERO_WORD * 3)
+EMPTY_OUTPUT_HASH = keccak(OUTPUT_TYPE_HASH + ZERO_WORD * 4)
+
 
 def hash_struct(tx, domain=None, verifying_contract=None):
     if domain and verifying_contract:
         raise RuntimeError("verifyingContract supplied but ignored")
 
-    verifying_address = hex_to_binary(verifying_contract.address) if verifying_contract else NULL_ADDRESS
+    if domain:
+        domain_separator = domain.hash_struct()
+    else:
+        domain_separator = _domain_separator(verifying_contract.address if verifying_contract else None)
 
-    domain = domain or make_domain(
-        name='OMG Network',
-        version='1',
+    return keccak(b'\x19\x01' + domain_separator + _hash_transaction(tx))
+
+
+@lru_cache(maxsize=None)
+def _domain_separator(verifying_contract_address):
+    verifying_address = hex_to_binary(verifying_contract_address) if verifying_contract_address else NULL_ADDRESS
+    domain = make_domain(
+        name=DOMAIN_NAME,
+        version=DOMAIN_VERSION,
         verifyingContract=verifying_address,
-        salt=hex_to_binary('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83')
+        salt=DOMAIN_SALT
     )
+    return domain.hash_struct()
 
-    return keccak(b'\x19\x01' + domain.hash_struct() + struct_tx_from_tx(tx).hash_struct())
-
-
-class Input(EIP712Struct):
-    blknum = Uint(256)
-    txindex = Uint(256)
-    oindex = Uint(256)
-
-
-class Output(EIP712Struct):
-    outputType = Uint(256)
-    outputGuard = Bytes(20)
-    currency = Address()
-    amount = Uint(256)
-
-
-class Transaction(EIP712Struct):
-    txType = Uint(256)
-    input0 = Input
-    input1 = Input
-    input2 = Input
-    input3 = Input
-    output0 = Output
-    output1 = Output
-    output2 = Output
-    output3 = Output
-    metadata = Bytes(32)
-
-
-def struct_tx_from_tx(tx):
-    inputs = _map_inputs(tx.inputs)
-    outputs = _map_outputs(tx.outputs)
-
-    return Transaction(
-        txType=tx.tx_type,
-        input0=inputs[0],
-        input1=inputs[1],
-        input2=inputs[2],
-        input3=inputs[3],
-        output0=outputs[0],
-        output1=outputs[1],
-        output2=outputs[2],
-        output3=outputs[3],
-        metadata=tx.metadata,
-    )
+
+def _hash_transaction(tx):
+    input_hashes = [_hash_input(i) for i in tx.inputs]
+    output_hashes = [_hash_output(o) for o in tx.outputs]
+
+    return keccak(b''.join([
+        TRANSACTION_TYPE_HASH,
+        _uint256(tx.tx_type),
+        *input_hashes,
+        EMPTY_INPUT_HASH * (NUM_TXOS - len(input_hashes)),  # pad with empty inputs
+        *output_hashes,
+        EMPTY_OUTPUT_HASH * (NUM_TXOS - len(output_hashes)),  # pad with empty outputs
+        tx.metadata
+    ]))
 
 
-def _map_inputs(inputs):
-    empty_input = Input()
+def _hash_input(tx_input):
+    return keccak(INPUT_TYPE_HASH + _uint256(tx_input.blknum) + _uint256(tx_input.txindex) + _uint256(tx_input.oindex))
 
-    eip712_inputs = [Input(blknum=i.blknum, txindex=i.txindex, oindex=i.oindex) for i in inputs]
-    return eip712_inputs + [empty_input] * (4 - len(inputs))  # pad with empty inputs
 
+def _hash_output(output):
+    return keccak(b''.join([
+        OUTPUT_TYPE_HASH,
+        _uint256(output.output_type),
+        output.output_guard.ljust(32, b'\x00'),  # bytes20 is padded on the right
+        output.token.rjust(32, b'\x00'),  # address is padded on the left
+        _uint256(output.amount)
+    ]))
 
-def _map_outputs(outputs):
-    empty_output = Output()
 
-    eip712_outputs = []
-    for o in outputs:
-        eip712_outputs.append(Output(outputType=o.output_type, outputGuard=o.output_guard, currency=o.token, amount=o.amount))
-    return eip712_outputs + [empty_output] * (4 - len(outputs))  # pad with empty outputs
+def _uint256(value):
+    return value.to_bytes(32, 'big')
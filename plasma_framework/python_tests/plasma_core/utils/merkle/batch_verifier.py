@@ -0,0 +1,56 @@
+import numpy as np
+from eth_utils import keccak as sha3
+from .fixed_merkle import HASH_SIZE
+
+
+def check_membership_batch(members, root, depth=16):
+    """Checks many Merkle membership proofs against a single root, level by level.
+
+    Mirrors `Merkle.checkMembership` for every (leaf, index, proof) triple of `members`:
+    a proof of any length other than `depth * 32` is considered invalid.
+
+    Returns:
+        numpy.ndarray: Boolean array, True where the corresponding proof is valid.
+    """
+    members = list(members)
+    if not members:
+        return np.zeros(0, dtype=bool)
+
+    leaves, indices, proofs = zip(*members)
+    count = len(members)
+    proof_size = depth * HASH_SIZE
+
+    well_formed = np.array([len(proof) == proof_size for proof in proofs], dtype=bool)
+    empty_proof = bytes(proof_size)
+    proof_words = np.frombuffer(
+        b''.join(bytes(proof) if ok else empty_proof for proof, ok in zip(proofs, well_formed)),
+        dtype=np.uint8
+    ).reshape(count, depth, HASH_SIZE)
+
+    indices = np.array(indices, dtype=np.uint64)
+    hashes = np.frombuffer(b''.join(sha3(leaf) for leaf in leaves), dtype=np.uint8).reshape(count, HASH_SIZE)
+
+    for height in range(depth):
+        # a node with an odd index at this height is a right child, so its sibling goes on the left
+        is_right = ((indices >> np.uint64(height)) & np.uint64(1)).astype(bool)[:, np.newaxis]
+        siblings = proof_words[:, height]
+        pairs = np.concatenate((np.where(is_right, siblings, hashes), np.where(is_right, hashes, siblings)), axis=1)
+        hashes = _hash_rows(pairs)
+
+    expected_root = np.frombuffer(root, dtype=np.uint8)
+    return (hashes == expected_root).all(axis=1) & well_formed
+
+
+def _hash_rows(rows):
+    """Hashes every row of a 2-D uint8 array, computing each distinct row only once.
+
+    Proofs coming from the same block share the upper part of their paths,
+    so most of the rows on the higher levels are duplicates.
+    """
+    rows = np.ascontiguousarray(rows)
+    row_size = rows.shape[1]
+    keys = rows.view(np.dtype((np.void, row_size))).ravel()
+    distinct, inverse = np.unique(keys, return_inverse=True)
+    data = distinct.tobytes()
+    digests = b''.join(sha3(data[i:i + row_size]) for i in range(0, len(data), row_size))
+    return np.frombuffer(digests, dtype=np.uint8).reshape(len(distinct), HASH_SIZE)[inverse.ravel()]
@@ -0,0 +1,79 @@
+import mmap
+import os
+import struct
+import tempfile
+
+from .fixed_merkle import FixedMerkle
+
+LENGTH = struct.Struct('<Q')
+
+
+def compute_block_roots(blocks, executor=None, depth=16, jobs_per_worker=4):
+    """Computes the Merkle roots of many blocks, in parallel if an executor is given.
+
+    Encoded transactions of all the blocks are written once to a temporary file,
+    which workers map into memory, so that only block boundaries are sent to them.
+
+    Args:
+        blocks (iterable): Lists of encoded transactions, one list per block.
+        executor (concurrent.futures.Executor): Optional pool, e.g. a ProcessPoolExecutor, to compute the roots with.
+        depth (int): Depth of the Merkle tree of a block.
+        jobs_per_worker (int): Number of jobs the blocks are split into per worker of the executor.
+
+    Returns:
+        list: Roots of the blocks, in order.
+    """
+    if executor is None:
+        return [FixedMerkle(depth, list(encoded_transactions)).root for encoded_transactions in blocks]
+
+    fd, path = tempfile.mkstemp(prefix='block-roots-')
+    try:
+        with os.fdopen(fd, 'wb') as data_file:
+            boundaries = _write_blocks(data_file, blocks)
+
+        workers = getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+        job_size = max(1, -(-len(boundaries) // (workers * jobs_per_worker)))
+        jobs = [(path, depth, boundaries[i:i + job_size]) for i in range(0, len(boundaries), job_size)]
+        return [root for roots in executor.map(_compute_roots, jobs) for root in roots]
+    finally:
+        os.remove(path)
+
+
+def _write_blocks(data_file, blocks):
+    """Writes every transaction as a length followed by its encoding.
+
+    Returns:
+        list: (offset, number of transactions) of every block.
+    """
+    boundaries = []
+    offset = 0
+    for encoded_transactions in blocks:
+        boundaries.append((offset, len(encoded_transactions)))
+        for encoded_tx in encoded_transactions:
+            data_file.write(LENGTH.pack(len(encoded_tx)))
+            data_file.write(encoded_tx)
+            offset += LENGTH.size + len(encoded_tx)
+    return boundaries
+
+
+def _compute_roots(job):
+    path, depth, boundaries = job
+    if os.path.getsize(path) == 0:
+        # an empty file can not be mapped, every block in it is empty as well
+        return [FixedMerkle(depth).root for _ in boundaries]
+
+    with open(path, 'rb') as data_file:
+        data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        roots = []
+        for offset, tx_count in boundaries:
+            encoded_transactions = []
+            for _ in range(tx_count):
+                (length,) = LENGTH.unpack_from(data, offset)
+                offset += LENGTH.size
+                encoded_transactions.append(data[offset:offset + length])
+                offset += length
+            roots.append(FixedMerkle(depth, encoded_transactions).root)
+        return roots
+    finally:
+        data.close()
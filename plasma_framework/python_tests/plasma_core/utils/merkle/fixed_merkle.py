@@ -2,16 +2,33 @@ from eth_utils import keccak as sha3
 from .exceptions import MemberNotExistException
 from plasma_core.constants import NULL_HASH
 
+HASH_SIZE = 32
+EMPTY_LEAF = sha3(NULL_HASH)
 
-class MerkleNode(object):
+# ZERO_HASHES[i] is the root of an empty subtree of height i, same as ZeroHashesProvider.sol computes on-chain
+ZERO_HASHES = [EMPTY_LEAF]
 
-    def __init__(self, data, left=None, right=None):
-        self.data = data
-        self.left = left
-        self.right = right
+
+def zero_hashes(depth):
+    """Returns the roots of empty subtrees of heights 0 to `depth` inclusive"""
+    while len(ZERO_HASHES) <= depth:
+        ZERO_HASHES.append(sha3(ZERO_HASHES[-1] * 2))
+    return ZERO_HASHES[:depth + 1]
+
+
+zero_hashes(16)  # depth of a plasma block
 
 
 class FixedMerkle(object):
+    """Merkle tree of a fixed depth, stored as flat levels of 32-byte slots.
+
+    `levels[0]` holds the hashed leaves and `levels[depth]` holds the root of a non-empty tree,
+    so a node at `index` on level `i` lives at `levels[i][index * 32:(index + 1) * 32]`.
+
+    The tree is sparse: a level only stores the nodes that have a real leaf below them.
+    Everything to the right of those is an empty subtree, whose hash is taken from `ZERO_HASHES`,
+    so building the tree costs O(number of leaves + depth) hashes instead of O(2 ** depth).
+    """
 
     def __init__(self, depth, leaves=[]):
         if depth < 1:
@@ -23,30 +40,31 @@ class FixedMerkle(object):
         if len(leaves) > self.leaf_count:
             raise ValueError('number of leaves should be at most depth ** 2')
 
-        leaves = [sha3(leaf) for leaf in leaves]
-
-        self.leaves = leaves + [sha3(NULL_HASH)] * (self.leaf_count - len(leaves))
-        self.tree = [self.__create_nodes(self.leaves)]
-        self.__create_tree(self.tree[0])
+        hashed_leaves = [sha3(leaf) for leaf in leaves]
 
-    def __create_nodes(self, leaves):
-        return [MerkleNode(leaf) for leaf in leaves]
+        self.member_count = len(hashed_leaves)
+        self._leaf_index = {}
+        for index, hashed_leaf in enumerate(hashed_leaves):
+            self._leaf_index.setdefault(hashed_leaf, index)
 
-    def __create_tree(self, leaves):
-        if len(leaves) == 1:
-            self.root = leaves[0].data
-            return
+        self.zero_hashes = zero_hashes(depth)
+        self.levels = [b''.join(hashed_leaves)]
+        self.__create_tree()
 
-        next_level = len(leaves)
-        tree_level = []
+    def __create_tree(self):
+        level = self.levels[0]
+        for height in range(self.depth):
+            if len(level) % (2 * HASH_SIZE):
+                level += self.zero_hashes[height]
+            level = b''.join(sha3(level[i:i + 2 * HASH_SIZE]) for i in range(0, len(level), 2 * HASH_SIZE))
+            self.levels.append(level)
+        self.root = level or self.zero_hashes[self.depth]
 
-        for i in range(0, next_level, 2):
-            combined = sha3(leaves[i].data + leaves[i + 1].data)
-            next_node = MerkleNode(combined, leaves[i], leaves[i + 1])
-            tree_level.append(next_node)
-
-        self.tree.append(tree_level)
-        self.__create_tree(tree_level)
+    @property
+    def leaves(self):
+        level = self.levels[0]
+        hashed_leaves = [level[i:i + HASH_SIZE] for i in range(0, len(level), HASH_SIZE)]
+        return hashed_leaves + [EMPTY_LEAF] * (self.leaf_count - self.member_count)
 
     def check_membership(self, leaf, index, proof):
         hashed_leaf = sha3(leaf)
@@ -65,23 +83,57 @@ class FixedMerkle(object):
         return computed_hash == self.root
 
     def create_membership_proof(self, leaf):
-        hashed_leaf = sha3(leaf)
-        if not self.__is_member(hashed_leaf):
+        index = self.__index_of(sha3(leaf))
+        if index is None:
             raise MemberNotExistException('leaf is not in the merkle tree')
 
-        index = self.leaves.index(hashed_leaf)
-        proof = b''
-
-        for i in range(0, self.depth, 1):
-            if index % 2 == 0:
-                sibling_index = index + 1
-            else:
-                sibling_index = index - 1
+        proof = []
+        for height in range(self.depth):
+            proof.append(self.__node(height, index ^ 1))
             index = index // 2
 
-            proof += self.tree[i][sibling_index].data
-
-        return proof
-
-    def __is_member(self, leaf):
-        return leaf in self.leaves
+        return b''.join(proof)
+
+    def proofs_for_all(self):
+        """Creates membership proofs of all the real leaves, in order"""
+        return self.proofs_for(range(self.member_count))
+
+    def proofs_for(self, indices):
+        """Creates membership proofs of the leaves at the given indices in a single pass over the tree.
+
+        All proofs are written into one preallocated buffer and returned as memoryview slices of it,
+        so no per-proof bytes objects are created.
+        """
+        positions = list(indices)
+        for index in positions:
+            if not 0 <= index < self.leaf_count:
+                raise ValueError('leaf index out of range')
+
+        proof_size = self.depth * HASH_SIZE
+        buffer = bytearray(len(positions) * proof_size)
+        for height in range(self.depth):
+            level = memoryview(self.levels[height])
+            level_size = len(level)
+            zero_hash = self.zero_hashes[height]
+            offset = height * HASH_SIZE
+            for k, index in enumerate(positions):
+                sibling_offset = (index ^ 1) * HASH_SIZE
+                node = level[sibling_offset:sibling_offset + HASH_SIZE] if sibling_offset < level_size else zero_hash
+                buffer[offset:offset + HASH_SIZE] = node
+                positions[k] = index // 2
+                offset += proof_size
+
+        proofs = memoryview(buffer)
+        return [proofs[i:i + proof_size] for i in range(0, len(buffer), proof_size)]
+
+    def __node(self, height, index):
+        offset = index * HASH_SIZE
+        node = self.levels[height][offset:offset + HASH_SIZE]
+        return node or self.zero_hashes[height]
+
+    def __index_of(self, hashed_leaf):
+        index = self._leaf_index.get(hashed_leaf)
+        if index is None and hashed_leaf == EMPTY_LEAF and self.member_count < self.leaf_count:
+            # padding leaves are members too, the first of them comes right after the real leaves
+            index = self.member_count
+        return index
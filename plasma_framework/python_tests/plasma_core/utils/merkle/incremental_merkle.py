@@ -0,0 +1,58 @@
+from eth_utils import keccak as sha3
+from .fixed_merkle import zero_hashes
+
+
+class IncrementalMerkle(object):
+    """Append-only Merkle tree of a fixed depth, producing the same root as `FixedMerkle`.
+
+    Only the frontier is kept: for every height, the last left node still waiting for its right sibling.
+    Appending a leaf and reading the root both cost O(depth) hashes, whatever the number of leaves.
+    """
+
+    def __init__(self, depth, leaves=[]):
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+
+        self.depth = depth
+        self.leaf_count = 2 ** depth
+        self.member_count = 0
+        self.zero_hashes = zero_hashes(depth)
+        self._frontier = [None] * depth
+        self._root = self.zero_hashes[depth]
+
+        for leaf in leaves:
+            self.append(leaf)
+
+    def append(self, leaf):
+        if self.member_count >= self.leaf_count:
+            raise ValueError('number of leaves should be at most depth ** 2')
+
+        node = sha3(leaf)
+        index = self.member_count
+        for height in range(self.depth):
+            if index % 2 == 0:
+                self._frontier[height] = node
+                break
+            node = sha3(self._frontier[height] + node)
+            index = index // 2
+
+        self.member_count += 1
+        # once the tree is full, the carried node is the root itself
+        self._root = node if self.member_count == self.leaf_count else None
+
+    @property
+    def root(self):
+        if self._root is None:
+            self._root = self.__compute_root()
+        return self._root
+
+    def __compute_root(self):
+        node = self.zero_hashes[0]
+        size = self.member_count
+        for height in range(self.depth):
+            if size % 2 == 1:
+                node = sha3(self._frontier[height] + node)
+            else:
+                node = sha3(node + self.zero_hashes[height])
+            size = size // 2
+        return node
@@ -0,0 +1,55 @@
+"""Helpers for working with RLP-encoded data in place, without decoding it as a whole.
+
+Offsets refer to any bytes-like buffer: bytes, memoryview or mmap.
+"""
+
+
+def item_bounds(buf, offset=0):
+    """Locates the RLP item starting at `offset`.
+
+    Returns:
+        (bool, int, int): Whether the item is a list, start and end of its payload.
+    """
+    prefix = buf[offset]
+    if prefix < 0x80:
+        return False, offset, offset + 1
+    if prefix < 0xb8:
+        return False, offset + 1, offset + 1 + prefix - 0x80
+    if prefix < 0xc0:
+        return _long_item_bounds(buf, offset, prefix - 0xb7, False)
+    if prefix < 0xf8:
+        return True, offset + 1, offset + 1 + prefix - 0xc0
+    return _long_item_bounds(buf, offset, prefix - 0xf7, True)
+
+
+def _long_item_bounds(buf, offset, length_of_length, is_list):
+    start = offset + 1 + length_of_length
+    length = int.from_bytes(buf[offset + 1:start], 'big')
+    return is_list, start, start + length
+
+
+def iter_list_items(buf, offset=0):
+    """Yields (start, end) offsets of every encoded item of the RLP list starting at `offset`"""
+    is_list, start, end = item_bounds(buf, offset)
+    if not is_list:
+        raise ValueError('RLP item is not a list')
+    while start < end:
+        _, _, item_end = item_bounds(buf, start)
+        yield start, item_end
+        start = item_end
+
+
+def list_item(buf, index, offset=0):
+    """Returns (start, end) offsets of the index-th encoded item of the RLP list starting at `offset`"""
+    for i, bounds in enumerate(iter_list_items(buf, offset)):
+        if i == index:
+            return bounds
+    raise IndexError('RLP list index out of range')
+
+
+def list_prefix(payload_length):
+    """Encodes the prefix of an RLP list whose items take `payload_length` bytes"""
+    if payload_length < 56:
+        return bytes([0xc0 + payload_length])
+    length = payload_length.to_bytes((payload_length.bit_length() + 7) // 8, 'big')
+    return bytes([0xf7 + len(length)]) + length
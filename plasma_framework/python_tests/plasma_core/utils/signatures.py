@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+from eth_keys.datatypes import PrivateKey, Signature
+from eth_keys.exceptions import BadSignature, ValidationError
+
+from plasma_core.constants import NULL_ADDRESS
+
+
+def sign_msg_hash(key, msg_hash):
+    """Signs a message hash in the format expected by the contracts.
+
+    Args:
+        key (PrivateKey): Key to sign with.
+        msg_hash (bytes): 32-byte hash to sign.
+
+    Returns:
+        bytes: 65-byte signature.
+    """
+    return amend_signature(key.sign_msg_hash(msg_hash).to_bytes())
+
+
+def sign_msg_hash_with_raw_key(job):
+    """Signs a (raw private key, message hash) pair.
+
+    Takes and returns plain bytes only, so it can be mapped over a process pool.
+    """
+    key_bytes, msg_hash = job
+    return sign_msg_hash(_private_key(key_bytes), msg_hash)
+
+
+@lru_cache(maxsize=1024)
+def _private_key(key_bytes):
+    # deriving the public key of a PrivateKey is costly, and there are far fewer keys than messages to sign
+    return PrivateKey(key_bytes)
+
+
+def recover_signer(msg_hash, signature):
+    """Recovers the address that produced a signature made with `sign_msg_hash`.
+
+    Takes and returns plain bytes only, so it can be mapped over a process pool.
+
+    Returns:
+        bytes: Canonical address of the signer, NULL_ADDRESS if the signature is malformed.
+    """
+    if len(signature) != 65:
+        return NULL_ADDRESS
+    vrs = (signature[64] - 27, int.from_bytes(signature[:32], 'big'), int.from_bytes(signature[32:64], 'big'))
+    try:
+        return Signature(vrs=vrs).recover_public_key_from_msg_hash(msg_hash).to_canonical_address()
+    except (BadSignature, ValidationError):
+        return NULL_ADDRESS
+
+
+def amend_signature(sig):
+    """ We are making it in order to make signatures produced by eth_keys library
+        compatible with openzellelin ECDSA public key recovery.
+
+        Please note:
+        https://github.com/OpenZeppelin/openzeppelin-contracts/blob/c3f2ed81683bd0095673f525f7ee9639370a2432/contracts/cryptography/ECDSA.sol#L53
+    """
+    sig_int = int.from_bytes(sig, 'big')
+    return (sig_int + 27).to_bytes(len(sig), 'big')
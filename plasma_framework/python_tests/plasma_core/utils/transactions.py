@@ -1,3 +1,5 @@
+import numpy as np
+
 BLKNUM_OFFSET = 1000000000
 TXINDEX_OFFSET = 10000
 
@@ -16,3 +18,26 @@ def encode_utxo_id(blknum, txindex, oindex):
 def decode_tx_id(utxo_id):
     (blknum, txindex, _) = decode_utxo_id(utxo_id)
     return encode_utxo_id(blknum, txindex, 0)
+
+
+def decode_utxo_ids(utxo_ids):
+    """Array version of `decode_utxo_id`, taking and returning numpy uint64 arrays"""
+    utxo_ids = np.asarray(utxo_ids, dtype=np.uint64)
+    blknums = utxo_ids // np.uint64(BLKNUM_OFFSET)
+    txindices = (utxo_ids % np.uint64(BLKNUM_OFFSET)) // np.uint64(TXINDEX_OFFSET)
+    oindices = utxo_ids % np.uint64(TXINDEX_OFFSET)
+    return blknums, txindices, oindices
+
+
+def encode_utxo_ids(blknums, txindices, oindices):
+    """Array version of `encode_utxo_id`, taking and returning numpy uint64 arrays"""
+    blknums = np.asarray(blknums, dtype=np.uint64)
+    txindices = np.asarray(txindices, dtype=np.uint64)
+    oindices = np.asarray(oindices, dtype=np.uint64)
+    return blknums * np.uint64(BLKNUM_OFFSET) + txindices * np.uint64(TXINDEX_OFFSET) + oindices
+
+
+def decode_tx_ids(utxo_ids):
+    """Array version of `decode_tx_id`, taking and returning numpy uint64 arrays"""
+    utxo_ids = np.asarray(utxo_ids, dtype=np.uint64)
+    return utxo_ids - utxo_ids % np.uint64(TXINDEX_OFFSET)
@@ -0,0 +1,88 @@
+from collections import defaultdict
+
+from eth_utils import address
+
+
+class UtxoSet(object):
+    """Unspent outputs of the child chain.
+
+    Outputs are keyed by their utxo position (see `encode_utxo_id`)
+    and additionally indexed by owner (output guard) and by token.
+    """
+
+    def __init__(self):
+        self.utxos = {}
+        self._by_owner = defaultdict(set)
+        self._by_token = defaultdict(set)
+
+    def __contains__(self, utxo_pos):
+        return utxo_pos in self.utxos
+
+    def __len__(self):
+        return len(self.utxos)
+
+    def get(self, utxo_pos):
+        return self.utxos.get(utxo_pos)
+
+    def add(self, utxo_pos, output):
+        self.utxos[utxo_pos] = output
+        self._by_owner[output.output_guard].add(utxo_pos)
+        self._by_token[output.token].add(utxo_pos)
+
+    def remove(self, utxo_pos):
+        output = self.utxos.pop(utxo_pos)
+        _discard(self._by_owner, output.output_guard, utxo_pos)
+        _discard(self._by_token, output.token, utxo_pos)
+        return output
+
+    def apply(self, spent, created):
+        """Spends and creates outputs as a single update, leaving the set untouched if any of it fails.
+
+        Args:
+            spent (iterable): Utxo positions to remove, all of them must be unspent.
+            created (list): (utxo position, output) pairs to add, none of them may exist yet.
+
+        Returns:
+            list: (utxo position, output) pairs that were removed, which undo the update when applied back.
+        """
+        spent = list(spent)
+        missing = [utxo_pos for utxo_pos in spent if utxo_pos not in self.utxos]
+        existing = [utxo_pos for utxo_pos, _ in created if utxo_pos in self.utxos]
+        if missing or existing or len(set(spent)) != len(spent):
+            raise KeyError('conflicting utxo update', missing, existing)
+
+        removed = []
+        try:
+            for utxo_pos in spent:
+                removed.append((utxo_pos, self.remove(utxo_pos)))
+            for utxo_pos, output in created:
+                self.add(utxo_pos, output)
+        except Exception:
+            for utxo_pos, _ in created:
+                if utxo_pos in self.utxos:
+                    self.remove(utxo_pos)
+            for utxo_pos, output in removed:
+                self.add(utxo_pos, output)
+            raise
+        return removed
+
+    def get_by_owner(self, owner):
+        """Returns unspent outputs of the owner, as a dict of utxo position -> output"""
+        return {utxo_pos: self.utxos[utxo_pos] for utxo_pos in self._by_owner.get(_canonical(owner), ())}
+
+    def get_by_token(self, token):
+        """Returns unspent outputs in the token, as a dict of utxo position -> output"""
+        return {utxo_pos: self.utxos[utxo_pos] for utxo_pos in self._by_token.get(_canonical(token), ())}
+
+
+def _discard(index, key, utxo_pos):
+    positions = index[key]
+    positions.discard(utxo_pos)
+    if not positions:
+        del index[key]
+
+
+def _canonical(value):
+    if isinstance(value, bytes) and len(value) == 20:
+        return value
+    return address.to_canonical_address(value)
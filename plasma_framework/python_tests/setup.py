@@ -28,7 +28,8 @@ setup(
         'py-solc-simple@git+https://github.com/omisego/py-solc-simple@plasma_contracts_tmp_compilation',
         'web3==5.0.0',
         'eip712-structs==1.1.0',
-        'eth_tester==0.2.0b2'
+        'eth_tester==0.2.0b2',
+        'numpy>=1.17.0'
     ],
     extras_require={
         'dev': [
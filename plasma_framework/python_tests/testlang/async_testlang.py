@@ -0,0 +1,71 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncTestingLanguage:
+    """Awaitable version of the testing language, for driving many actors concurrently.
+
+    Every method and property of the wrapped TestingLanguage is available as a coroutine, e.g.
+    `await testlang.start_standard_exit(output_id, owner)`, and independent calls can be gathered:
+
+        await asyncio.gather(*(testlang.start_standard_exit(utxo.spend_id, utxo.owner) for utxo in utxos))
+
+    Web3 5.0 has no async providers, so each call runs in a thread of the executor.
+    Calls that add blocks to the child chain depend on the next block number of the root chain,
+    so they are run one at a time under a lock. All other calls run concurrently, while `AutominingEth`
+    makes sure each root chain transaction is mined in a block of its own.
+
+    Attributes:
+        testlang (TestingLanguage): The wrapped testing language.
+        executor (concurrent.futures.Executor): Pool the calls run in.
+    """
+
+    SERIALIZED_METHODS = frozenset([
+        'create_utxo',
+        'deposit',
+        'deposit_many',
+        'deposit_token',
+        'spend_utxo',
+        'submit_block',
+    ])
+
+    def __init__(self, testlang, executor=None, max_workers=64):
+        self.testlang = testlang
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+        self._child_chain_lock = None
+        self._lock_loop = None
+
+    def __getattr__(self, item):
+        if isinstance(getattr(type(self.testlang), item, None), property):
+            return self._run(item, lambda: getattr(self.testlang, item))
+
+        attribute = getattr(self.testlang, item)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def method(*args, **kwargs):
+            return self._run(item, functools.partial(attribute, *args, **kwargs))
+
+        return method
+
+    @staticmethod
+    async def gather(*calls):
+        """Runs independent calls concurrently, returning their results in order"""
+        return await asyncio.gather(*calls)
+
+    def close(self):
+        self.executor.shutdown()
+
+    async def _run(self, name, call):
+        loop = asyncio.get_running_loop()
+        if name not in self.SERIALIZED_METHODS:
+            return await loop.run_in_executor(self.executor, call)
+
+        # created for every event loop the calls run in, e.g. one per `asyncio.run`, as a lock belongs to its loop
+        if self._lock_loop is not loop:
+            self._child_chain_lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._child_chain_lock:
+            return await loop.run_in_executor(self.executor, call)
@@ -0,0 +1,48 @@
+import threading
+from collections import OrderedDict
+
+
+class BlockProofCache(object):
+    """Merkle trees of recently used child chain blocks, for creating inclusion proofs.
+
+    For every cached block, keeps its tree, the one cached by `Block.merklized_transaction_set`,
+    along with a map of transaction hash -> index in the block.
+    Blocks of the child chain never change once added, so cached trees do not need invalidation.
+    At most `max_blocks` trees are kept, the least recently used are dropped first.
+    The cache can be shared by threads, see `AsyncTestingLanguage`.
+    """
+
+    def __init__(self, child_chain, max_blocks=64):
+        self.child_chain = child_chain
+        self.max_blocks = max_blocks
+        self._trees = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, blknum):
+        """Returns the Merkle tree of the block and a map of its transaction hashes to their indices"""
+        with self._lock:
+            entry = self._trees.get(blknum)
+            if entry is not None:
+                self._trees.move_to_end(blknum)
+                return entry
+
+        block = self.child_chain.get_block(blknum)
+        merkle = block.merklized_transaction_set
+        tx_indices = {}
+        for index, tx in enumerate(block.transactions):
+            tx_indices.setdefault(tx.hash, index)
+
+        entry = (merkle, tx_indices)
+        with self._lock:
+            self._trees[blknum] = entry
+            if len(self._trees) > self.max_blocks:
+                self._trees.popitem(last=False)
+        return entry
+
+    def create_membership_proof(self, blknum, tx):
+        """Creates the proof of inclusion of the transaction in the block"""
+        merkle, tx_indices = self.get(blknum)
+        index = tx_indices.get(tx.hash)
+        if index is None:
+            return merkle.create_membership_proof(tx.encoded)
+        return bytes(merkle.proofs_for([index])[0])
@@ -1,4 +1,5 @@
 import rlp
+from eth_tester.exceptions import TransactionFailed
 from web3.exceptions import MismatchedABI
 
 from plasma_core.child_chain import ChildChain
@@ -7,9 +8,13 @@ from plasma_core.transaction import Transaction, TransactionOutput
 from plasma_core.constants import MIN_EXIT_PERIOD, NULL_ADDRESS
 from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
 from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from testlang.block_proofs import BlockProofCache
 
 IN_FLIGHT_PERIOD = MIN_EXIT_PERIOD // 2
 
+# gas sent with each of the transactions of `TestingLanguage.deposit_many`
+DEPOSIT_GAS = 200000
+
 
 class StandardExit:
     """Represents a Plasma exit.
@@ -112,6 +117,7 @@ class TestingLanguage:
         accounts (EthereumAccount[]): List of available accounts.
         operator (EthereumAccount): The operator's account.
         child_chain (ChildChain): Child chain instance.
+        block_proofs (BlockProofCache): Merkle trees of recently used child chain blocks.
     """
 
     def __init__(self, plasma_framework, w3, accounts):
@@ -119,7 +125,8 @@ class TestingLanguage:
         self.w3 = w3
         self.accounts = accounts
         self.operator = self.accounts[0]
-        self.child_chain = ChildChain(operator=self.operator)
+        self.child_chain = ChildChain(operator=self.operator, verifying_contract=plasma_framework.plasma_framework)
+        self.block_proofs = BlockProofCache(self.child_chain)
         self.events_filters: dict = plasma_framework.event_filters(w3)
 
     def flush_events(self):
@@ -142,9 +149,7 @@ class TestingLanguage:
         signed_block = block.sign(signer.key)
         self.root_chain.submitBlock(signed_block.root, **{'from': signer.address})
         if force_invalid:
-            self.child_chain.blocks[self.child_chain.next_child_block] = signed_block
-            self.child_chain.next_deposit_block = self.child_chain.next_child_block + 1
-            self.child_chain.next_child_block += self.child_chain.child_block_interval
+            self.child_chain.force_add_block(signed_block)
         else:
             assert self.child_chain.add_block(signed_block)
         return blknum
@@ -187,6 +192,80 @@ class TestingLanguage:
         self.child_chain.add_block(block)
         return encode_utxo_id(blknum, 0, 0)
 
+    def deposit_many(self, deposits, gas=DEPOSIT_GAS):
+        """Makes many ETH and token deposits, mining as few root chain blocks as possible.
+
+        Auto-mining is disabled while the deposits are made. Tokens are minted and approved first,
+        once per owner and token for the sum of its deposits, as an approval replaces the previous one.
+        Then all deposit transactions are sent, and a block is mined whenever the next transaction
+        would not fit into its gas limit. Deposit block numbers are taken from the DepositCreated events.
+
+        Args:
+            deposits (list): (owner (EthereumAccount), token (NULL_ADDRESS OR MintableToken contract), amount) triples.
+            gas (int): Gas sent with each transaction.
+
+        Returns:
+            list: Identifiers of the deposits, in the order of `deposits`.
+        """
+        eth_vault, erc20_vault = self.root_chain.eth_vault, self.root_chain.erc20_vault
+        token_totals = {}  # (owner, token) -> amount to mint and approve
+        deposit_calls = []
+        vaults = []
+        deposit_txs = []
+        for owner, token, amount in deposits:
+            if token == NULL_ADDRESS:
+                deposit_tx = Transaction(outputs=[(owner.address, NULL_ADDRESS, amount)])
+                deposit_calls.append((eth_vault.functions.deposit(deposit_tx.encoded), {'from': owner.address, 'value': amount}))
+                vaults.append(eth_vault)
+            else:
+                deposit_tx = Transaction(outputs=[(owner.address, token.address, amount)])
+                key = (owner.address, token.address)
+                token_totals[key] = (token, token_totals.get(key, (token, 0))[1] + amount)
+                deposit_calls.append((erc20_vault.functions.deposit(deposit_tx.encoded), {'from': owner.address}))
+                vaults.append(erc20_vault)
+            deposit_txs.append(deposit_tx)
+
+        approvals = []
+        for (owner_address, _), (token, total) in token_totals.items():
+            approvals.append((token.functions.mint(owner_address, total), {}))
+            approvals.append((token.functions.approve(erc20_vault.address, total), {'from': owner_address}))
+
+        self.w3.eth.disable_auto_mine()
+        try:
+            self._transact_in_blocks(approvals, gas)
+            receipts = self._transact_in_blocks(deposit_calls, gas)
+        finally:
+            self.w3.eth.enable_auto_mine()
+
+        deposit_ids = []
+        for vault, receipt, deposit_tx in zip(vaults, receipts, deposit_txs):
+            (event,) = vault.events.DepositCreated().processReceipt(receipt)
+            blknum = event.args.blknum
+            self.child_chain.add_block(Block([deposit_tx], number=blknum))
+            deposit_ids.append(encode_utxo_id(blknum, 0, 0))
+        return deposit_ids
+
+    def _transact_in_blocks(self, calls, gas):
+        """Sends (function call, params) transactions, mining a block whenever it is full.
+
+        Returns:
+            list: Receipts of the transactions, in order.
+        """
+        block_gas_limit = self.w3.eth.getBlock('latest').gasLimit
+        txs_per_block = max(1, block_gas_limit // gas)
+        tx_hashes = []
+        for i, (function_call, params) in enumerate(calls):
+            tx_hashes.append(function_call.transact({'gasPrice': 0, 'gas': gas, **params}))
+            if (i + 1) % txs_per_block == 0:
+                self.w3.eth.mine()
+        if len(calls) % txs_per_block:
+            self.w3.eth.mine()
+
+        receipts = [self.w3.eth.getTransactionReceipt(tx_hash) for tx_hash in tx_hashes]
+        if any(receipt.status == 0 for receipt in receipts):
+            raise TransactionFailed
+        return receipts
+
     def spend_utxo(self, input_ids, accounts, outputs=None, metadata=None, force_invalid=False):
         if outputs is None:
             outputs = []
@@ -205,11 +284,10 @@ class TestingLanguage:
         return self.start_standard_exit_with_tx_body(output_id, output_tx, account, bond, block)
 
     def start_standard_exit_with_tx_body(self, output_id, output_tx, account, bond=None, block=None):
-        transactions = [output_tx]
         if block:
-            transactions = block.transactions
-        merkle = FixedMerkle(16, list(map(lambda tx: tx.encoded, transactions)))
-        proof = merkle.create_membership_proof(output_tx.encoded)
+            proof = block.merklized_transaction_set.create_membership_proof(output_tx.encoded)
+        else:
+            proof = FixedMerkle(16, [output_tx.encoded]).create_membership_proof(output_tx.encoded)
         bond = bond if bond is not None else self.root_chain.standardExitBond()
         self.root_chain.startStandardExit(output_id, output_tx.encoded, proof,
                                           **{'value': bond, 'from': account.address})
@@ -392,9 +470,7 @@ class TestingLanguage:
     def get_merkle_proof(self, tx_id):
         tx = self.child_chain.get_transaction(tx_id)
         (blknum, _, _) = decode_utxo_id(tx_id)
-        block = self.child_chain.get_block(blknum)
-        merkle = block.merklized_transaction_set
-        return merkle.create_membership_proof(tx.encoded)
+        return self.block_proofs.create_membership_proof(blknum, tx)
 
     def piggyback_in_flight_exit_input(self, tx_id, input_index, account, bond=None):
         spend_tx = self.child_chain.get_transaction(tx_id)
@@ -5,12 +5,13 @@ import pytest
 from eth_keys.datatypes import PrivateKey
 from solc_simple import Builder
 from solcx import link_code
-from web3 import Web3, HTTPProvider
+from web3 import Web3
 from web3.main import get_default_modules
 from xprocess import ProcessStarter
 
 from plasma_core.account import EthereumAccount
 from plasma_core.constants import NULL_ADDRESS
+from testlang.async_testlang import AsyncTestingLanguage
 from testlang.testlang import TestingLanguage
 from tests.tests_utils.constants import (
     HUNDRED_ETH,
@@ -19,6 +20,7 @@ from tests.tests_utils.constants import (
     INITIAL_IMMUNE_VAULTS,
     INITIAL_IMMUNE_EXIT_GAMES,
 )
+from tests.tests_utils.batching_provider import BatchingHTTPProvider
 from tests.tests_utils.convenience_wrappers import ConvenienceContractWrapper, AutominingEth
 from tests.tests_utils.deployer import Deployer
 from tests.tests_utils.plasma_framework import PlasmaFramework
@@ -95,7 +97,7 @@ def _w3_session(xprocess, accounts, ganache_port):
     web3_modules = get_default_modules()
     web3_modules.update(eth=(AutominingEth,))
 
-    _w3 = Web3(HTTPProvider(endpoint_uri=f'http://localhost:{ganache_port}'), modules=web3_modules)
+    _w3 = Web3(BatchingHTTPProvider(endpoint_uri=f'http://localhost:{ganache_port}'), modules=web3_modules)
     if not _w3.isConnected():  # try to connect to an external ganache
         xprocess.ensure(f'GANACHE_{ganache_port}', ganache_cli(accounts, ganache_port))
         assert _w3.provider.make_request('miner_stop', [])['result']
@@ -149,6 +151,13 @@ def testlang(plasma_framework, w3, accounts):
     return TestingLanguage(plasma_framework, w3, accounts)
 
 
+@pytest.fixture
+def async_testlang(testlang):
+    async_testlang = AsyncTestingLanguage(testlang)
+    yield async_testlang
+    async_testlang.close()
+
+
 @pytest.fixture(params=["ERC20Mintable"])
 def token(get_contract, request):
     return get_contract(request.param)
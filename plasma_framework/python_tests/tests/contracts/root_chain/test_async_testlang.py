@@ -0,0 +1,28 @@
+import asyncio
+
+from plasma_core.constants import NULL_ADDRESS
+
+
+def test_concurrent_standard_exits_should_succeed(async_testlang):
+    owners = async_testlang.accounts[1:5]
+
+    async def scenario():
+        deposit_ids = await async_testlang.gather(*(async_testlang.deposit(owner, 100) for owner in owners))
+        spend_ids = await async_testlang.gather(*(
+            async_testlang.spend_utxo([deposit_id], [owner], [(owner.address, NULL_ADDRESS, 100)])
+            for deposit_id, owner in zip(deposit_ids, owners)
+        ))
+        await async_testlang.gather(*(async_testlang.start_standard_exit(spend_id, owner)
+                                      for spend_id, owner in zip(spend_ids, owners)))
+        exits = await async_testlang.gather(*(async_testlang.get_standard_exit(spend_id) for spend_id in spend_ids))
+        return spend_ids, exits
+
+    spend_ids, exits = asyncio.run(scenario())
+
+    assert len(set(spend_ids)) == len(owners)
+    assert exits == [[owner.address, 100, spend_id, True] for owner, spend_id in zip(owners, spend_ids)]
+
+
+def test_properties_are_awaitable(async_testlang, testlang):
+    assert asyncio.run(async_testlang.timestamp) == testlang.timestamp
+    assert async_testlang.child_chain is testlang.child_chain
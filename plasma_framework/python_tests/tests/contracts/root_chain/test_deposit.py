@@ -4,7 +4,7 @@ from eth_tester.exceptions import TransactionFailed
 from plasma_core.block import Block
 from plasma_core.constants import NULL_ADDRESS
 from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
-from plasma_core.transaction import Transaction
+from plasma_core.transaction import Transaction, TransactionOutput
 from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
 
 
@@ -86,6 +86,35 @@ def test_token_deposit_should_succeed(testlang, plasma_framework, token):
     assert plasma_framework.nextDepositBlock() == 2
 
 
+def test_deposit_many_should_succeed(testlang, plasma_framework, token):
+    owner, other = testlang.accounts[0], testlang.accounts[1]
+    deposits = [(owner, NULL_ADDRESS, 100), (other, token, 200), (owner, token, 300), (other, NULL_ADDRESS, 400)]
+
+    deposit_ids = testlang.deposit_many(deposits)
+
+    assert sorted(decode_utxo_id(deposit_id)[0] for deposit_id in deposit_ids) == [1, 2, 3, 4]
+    for deposit_id, (deposit_owner, deposit_token, amount) in zip(deposit_ids, deposits):
+        deposit_blknum, _, _ = decode_utxo_id(deposit_id)
+        token_address = NULL_ADDRESS if deposit_token == NULL_ADDRESS else deposit_token.address
+        output = testlang.child_chain.get_transaction(deposit_id).outputs[0]
+        assert output == TransactionOutput(deposit_owner.address, token_address, amount)
+        assert testlang.get_plasma_block(deposit_blknum).root == testlang.child_chain.get_block(deposit_blknum).root
+    assert plasma_framework.nextDepositBlock() == 5
+    assert testlang.get_balance(plasma_framework.erc20_vault, token) == 500
+
+
+def test_deposit_many_same_owner_token_deposits_should_succeed(testlang, plasma_framework, token):
+    owner = testlang.accounts[0]
+    deposits = [(owner, token, 100), (owner, token, 200), (owner, NULL_ADDRESS, 300), (owner, token, 400)]
+
+    deposit_ids = testlang.deposit_many(deposits)
+
+    amounts = [testlang.child_chain.get_transaction(deposit_id).outputs[0].amount for deposit_id in deposit_ids]
+    assert amounts == [100, 200, 300, 400]
+    assert testlang.get_balance(plasma_framework.erc20_vault, token) == 700
+    assert token.balanceOf(owner.address) == 0
+
+
 def test_token_deposit_non_existing_token_should_fail(testlang, token):
     owner, amount = testlang.accounts[0], 100
     deposit_tx = Transaction(outputs=[(owner.address, NULL_ADDRESS, amount)])
@@ -0,0 +1,22 @@
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from tests.tests_utils.plasma_core import OPERATOR, make_block
+
+
+def test_hash_and_root_are_computed_once():
+    block = make_block(2000, 3)
+
+    assert block.hash is block.hash
+    assert block.merklized_transaction_set is block.merklized_transaction_set
+    assert block.root == FixedMerkle(16, [tx.encoded for tx in block.transactions]).root
+
+
+def test_signed_block_reuses_block_hash():
+    block = make_block(2000, 3)
+    block_hash = block.hash
+
+    signed_block = block.sign(OPERATOR.key)
+
+    assert signed_block.hash is block_hash
+    assert signed_block.root == block.root
+    assert signed_block.signer == OPERATOR.key.public_key.to_checksum_address()
+    assert signed_block.signer is signed_block.signer
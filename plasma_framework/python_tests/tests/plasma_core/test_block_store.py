@@ -0,0 +1,128 @@
+import os
+
+import pytest
+import rlp
+
+from plasma_core.block import Block, SignedBlock
+from plasma_core.block_store import FileBlockStore, decode_block_record
+from plasma_core.utils.rlp_stream import list_prefix
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from tests.tests_utils.plasma_core import OPERATOR, OWNER, make_block
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return str(tmp_path / 'blocks')
+
+
+def test_store_and_read_blocks(store_dir):
+    deposit_block = Block([Transaction(outputs=[(OWNER, NULL_ADDRESS, 100)])], number=1)
+    child_block = make_block(1000, 3).sign(OPERATOR.key)
+
+    with FileBlockStore(store_dir, max_cached_blocks=0) as store:
+        store[1] = deposit_block
+        store[1000] = child_block
+
+        assert 1000 in store and 2000 not in store
+        assert list(store) == [1, 1000]
+
+        read_deposit_block = store[1]
+        assert not isinstance(read_deposit_block, SignedBlock)
+        assert read_deposit_block.hash == deposit_block.hash
+
+        read_child_block = store[1000]
+        assert read_child_block.root == child_block.root
+        assert read_child_block.signer == child_block.signer
+
+        assert store.get_transaction(1000, 2).encoded == child_block.transactions[2].encoded
+
+
+def test_transaction_signatures_are_stored(store_dir):
+    block = make_block(1000, 2)
+    block.transactions[1].signatures[0] = OPERATOR.key.sign_msg_hash(block.transactions[1].hash).to_bytes()
+
+    with FileBlockStore(store_dir, max_cached_blocks=0) as store:
+        store[1000] = block
+
+        assert store[1000].transactions[1].signatures == block.transactions[1].signatures
+        assert store.get_transaction(1000, 1).signatures == block.transactions[1].signatures
+
+
+def test_read_record_without_version():
+    block = make_block(1000, 2).sign(OPERATOR.key)
+    payload = rlp.encode(block.signature) + block.encoded
+
+    read_block = decode_block_record(list_prefix(len(payload)) + payload)
+
+    assert read_block.hash == block.hash
+    assert read_block.signer == block.signer
+
+
+def test_unknown_record_version_is_rejected():
+    block = make_block(1000, 2)
+    payload = rlp.encode(2) + rlp.encode(b'') + block.encoded + rlp.encode([tx.signatures for tx in block.transactions])
+    record = list_prefix(len(payload)) + payload
+
+    with pytest.raises(ValueError):
+        decode_block_record(record)
+
+
+def test_decoded_blocks_are_cached(store_dir):
+    blocks = [make_block(number, 2) for number in (1000, 2000, 3000)]
+    with FileBlockStore(store_dir, max_cached_blocks=2) as store:
+        for block in blocks:
+            store[block.number] = block
+
+        assert store[3000] is blocks[2]
+        read_block = store[1000]
+        assert read_block is not blocks[0] and read_block.hash == blocks[0].hash
+        assert store[1000] is read_block
+        assert store.get_transaction(1000, 1) is read_block.transactions[1]
+        assert list(store._blocks) == [3000, 1000]
+
+
+def test_blocks_survive_reopening(store_dir):
+    blocks = [make_block(number, 2).sign(OPERATOR.key) for number in (1000, 2000, 3000)]
+    with FileBlockStore(store_dir) as store:
+        for block in blocks[:2]:
+            store[block.number] = block
+
+    with FileBlockStore(store_dir) as store:
+        store[3000] = blocks[2]
+        assert [store[block.number].hash for block in blocks] == [block.hash for block in blocks]
+
+
+def test_blocks_survive_torn_index_entry(store_dir):
+    blocks = [make_block(number, 2) for number in (1000, 2000, 3000, 4000)]
+    with FileBlockStore(store_dir) as store:
+        for block in blocks[:2]:
+            store[block.number] = block
+    with open(os.path.join(store_dir, FileBlockStore.INDEX_NAME), 'ab') as index_file:
+        index_file.write(b'\xff' * 7)
+
+    with FileBlockStore(store_dir) as store:
+        assert list(store) == [1000, 2000]
+        for block in blocks[2:]:
+            store[block.number] = block
+
+    with FileBlockStore(store_dir) as store:
+        assert list(store) == [1000, 2000, 3000, 4000]
+        assert [store[block.number].hash for block in blocks] == [block.hash for block in blocks]
+
+
+def test_blocks_span_segments(store_dir):
+    with FileBlockStore(store_dir, segment_size=1024) as store:
+        for number in range(1000, 11000, 1000):
+            store[number] = make_block(number, 5)
+        assert store._segment > 0
+
+    with FileBlockStore(store_dir, segment_size=1024) as store:
+        for number in range(1000, 11000, 1000):
+            assert store.get_transaction(number, 4).inputs[0].blknum == number
+
+
+def test_missing_block(store_dir):
+    with FileBlockStore(store_dir) as store:
+        with pytest.raises(KeyError):
+            store[1000]
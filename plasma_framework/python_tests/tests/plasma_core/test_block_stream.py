@@ -0,0 +1,56 @@
+import io
+import mmap
+
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.block_stream import iter_transactions, read_block_number, write_block
+from tests.tests_utils.plasma_core import make_transactions
+
+
+def test_write_block_matches_block_encoding():
+    for count in (0, 1, 300):
+        transactions = make_transactions(count)
+        stream = io.BytesIO()
+
+        written = write_block(stream, transactions, 2000)
+
+        assert stream.getvalue() == Block(transactions, number=2000).encoded
+        assert written == len(stream.getvalue())
+
+
+def test_write_block_rejects_generator():
+    stream = io.BytesIO()
+
+    with pytest.raises(TypeError):
+        write_block(stream, (tx for tx in make_transactions(3)), 2000)
+    assert stream.getvalue() == b''
+
+
+def test_iter_transactions():
+    transactions = make_transactions(300)
+    encoded = Block(transactions, number=2000).encoded
+
+    views = list(iter_transactions(encoded))
+
+    assert read_block_number(encoded) == 2000
+    assert [view.hash for view in views] == [tx.hash for tx in transactions]
+    assert views[7].inputs[0].txindex == 7
+    assert views[7].outputs[0].amount == 7
+    assert views[7].hash is views[7].hash
+
+
+def test_iter_transactions_at_offset_of_mmap(tmp_path):
+    transactions = make_transactions(10)
+    path = str(tmp_path / 'block')
+    with open(path, 'wb') as block_file:
+        block_file.write(b'\xff' * 5)
+        write_block(block_file, transactions, 3000)
+
+    with open(path, 'rb') as block_file:
+        block_map = mmap.mmap(block_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        assert read_block_number(block_map, 5) == 3000
+        assert [view.decode().encoded for view in iter_transactions(block_map, 5)] == [tx.encoded for tx in transactions]
+    finally:
+        block_map.close()
@@ -0,0 +1,265 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.block_store import FileBlockStore, decode_block_record, encode_block_record
+from plasma_core.child_chain import ChildChain
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
+from tests.tests_utils.plasma_core import ALICE, BOB, OPERATOR, VerifyingContract
+
+
+@pytest.fixture
+def child_chain():
+    return ChildChain(OPERATOR, verifying_contract=VerifyingContract)
+
+
+def deposit(child_chain, owner, amount):
+    blknum = child_chain.next_deposit_block
+    assert child_chain.add_block(Block([Transaction(outputs=[(owner.address, NULL_ADDRESS, amount)])], number=blknum))
+    return encode_utxo_id(blknum, 0, 0)
+
+
+def spend(input_ids, owners, outputs, metadata=None):
+    tx = Transaction(inputs=[decode_utxo_id(input_id) for input_id in input_ids], outputs=outputs, metadata=metadata)
+    for index, owner in enumerate(owners):
+        tx.sign(index, owner, verifying_contract=VerifyingContract)
+    return tx
+
+
+def submit(child_chain, operator, transactions):
+    return child_chain.add_block(Block(transactions, number=child_chain.next_child_block).sign(operator.key))
+
+
+def test_spend_deposit(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+    assert child_chain.is_spent(deposit_id)
+    assert not child_chain.is_spent(encode_utxo_id(1000, 0, 0))
+    assert set(child_chain.utxos.get_by_owner(BOB.address)) == {encode_utxo_id(1000, 0, 0)}
+    assert child_chain.utxos.get_by_owner(ALICE.address) == {}
+
+
+def test_double_spend_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+    assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+    assert not submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(ALICE.address, NULL_ADDRESS, 100)])])
+
+
+def test_spend_signed_by_non_owner_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    assert not submit(child_chain, OPERATOR, [spend([deposit_id], [BOB], [(BOB.address, NULL_ADDRESS, 100)])])
+    assert not child_chain.is_spent(deposit_id)
+
+
+def test_spend_signed_for_other_contract_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+    tx = Transaction(inputs=[(1, 0, 0)], outputs=[(BOB.address, NULL_ADDRESS, 100)])
+    tx.sign(0, ALICE)
+
+    assert not submit(child_chain, OPERATOR, [tx])
+    assert not child_chain.is_spent(deposit_id)
+
+
+def test_block_signed_by_non_operator_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    assert not submit(child_chain, BOB, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+
+def test_spending_more_than_inputs_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    assert not submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 101)])])
+
+
+def test_force_add_block_does_not_spend_inputs(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    child_chain.force_add_block(Block([spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])],
+                                      number=child_chain.next_child_block))
+
+    assert not child_chain.is_spent(deposit_id)
+    assert not child_chain.is_spent(encode_utxo_id(1000, 0, 0))
+    assert child_chain.next_child_block == 2000
+
+
+def test_child_chain_with_file_block_store(tmp_path):
+    with FileBlockStore(str(tmp_path)) as store:
+        child_chain = ChildChain(OPERATOR, verifying_contract=VerifyingContract, block_store=store)
+        deposit_id = deposit(child_chain, ALICE, 100)
+        assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+        assert child_chain.get_transaction(encode_utxo_id(1000, 0, 0)).outputs[0].amount == 100
+        assert child_chain.get_block(1000).signer == OPERATOR.address
+
+
+def test_restore_from_snapshot(tmp_path, child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+    assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+    other_deposit_id = deposit(child_chain, ALICE, 50)
+    orphan = Block([spend([other_deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 50)])], number=3000).sign(OPERATOR.key)
+    assert not child_chain.add_block(orphan)
+
+    snapshot_path = str(tmp_path / 'snapshot')
+    child_chain.save_snapshot(snapshot_path)
+
+    restored = ChildChain(OPERATOR, verifying_contract=VerifyingContract)
+    restored.load_snapshot(snapshot_path)
+
+    assert (restored.next_child_block, restored.next_deposit_block) == (2000, 1002)
+    assert restored.utxos.utxos == child_chain.utxos.utxos
+    assert [block.hash for block in restored.pending_blocks] == [orphan.hash]
+    # blocks after the snapshot height replay on top of the restored state, releasing the orphan
+    assert submit(restored, OPERATOR, [spend([encode_utxo_id(1000, 0, 0)], [BOB], [(ALICE.address, NULL_ADDRESS, 100)])])
+    assert restored.next_child_block == 4000
+    assert set(restored.utxos.get_by_owner(ALICE.address)) == {encode_utxo_id(2000, 0, 0)}
+    assert set(restored.utxos.get_by_owner(BOB.address)) == {encode_utxo_id(3000, 0, 0)}
+
+
+def test_stored_blocks_can_be_replayed(tmp_path):
+    with FileBlockStore(str(tmp_path)) as store:
+        child_chain = ChildChain(OPERATOR, verifying_contract=VerifyingContract, block_store=store)
+        deposit_id = deposit(child_chain, ALICE, 100)
+        assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+        replayed = ChildChain(OPERATOR, verifying_contract=VerifyingContract)
+        assert all(replayed.add_block(store[blknum]) for blknum in store)
+
+    assert replayed.utxos.utxos == child_chain.utxos.utxos
+
+
+def test_child_block_ahead_of_head_is_added_once_parent_arrives(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+    later = Block([spend([encode_utxo_id(1000, 0, 0)], [BOB], [(ALICE.address, NULL_ADDRESS, 100)])], number=2000).sign(OPERATOR.key)
+
+    assert not child_chain.add_block(later)
+    assert 2000 in child_chain.pending_blocks
+
+    assert submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+    assert child_chain.next_child_block == 3000
+    assert len(child_chain.pending_blocks) == 0
+    assert set(child_chain.utxos.get_by_owner(ALICE.address)) == {encode_utxo_id(2000, 0, 0)}
+
+
+def test_pending_deposits_are_added_before_next_child_block(child_chain):
+    deposits = [Block([Transaction(outputs=[(ALICE.address, NULL_ADDRESS, amount)])], number=blknum)
+                for blknum, amount in [(1, 10), (2, 20), (3, 30)]]
+    later = Block([spend([encode_utxo_id(3, 0, 0)], [ALICE], [(ALICE.address, NULL_ADDRESS, 30)])], number=2000).sign(OPERATOR.key)
+
+    for block in [later, deposits[2], deposits[1]]:
+        assert not child_chain.add_block(block)
+    assert child_chain.add_block(deposits[0])
+    assert child_chain.next_deposit_block == 4
+
+    assert submit(child_chain, OPERATOR, [])
+
+    assert (child_chain.next_child_block, child_chain.next_deposit_block) == (3000, 2001)
+    assert set(child_chain.utxos.get_by_owner(ALICE.address)) == {encode_utxo_id(blknum, 0, 0) for blknum in (1, 2, 2000)}
+
+
+def test_long_run_of_pending_blocks_is_added(child_chain):
+    blocks = [Block([], number=blknum).sign(OPERATOR.key) for blknum in range(1000, 1001000, 1000)]
+
+    for block in reversed(blocks[1:]):
+        assert not child_chain.add_block(block)
+    assert child_chain.add_block(blocks[0])
+
+    assert child_chain.next_child_block == 1001000
+    assert len(child_chain.pending_blocks) == 0
+
+
+def test_pending_blocks_behind_head_are_dropped(child_chain):
+    deposit(child_chain, ALICE, 100)
+    stale = Block([Transaction(outputs=[(ALICE.address, NULL_ADDRESS, 1)])], number=5)
+    assert not child_chain.add_block(stale)
+
+    assert submit(child_chain, OPERATOR, [])
+
+    assert len(child_chain.pending_blocks) == 0
+    assert not child_chain.is_spent(encode_utxo_id(1, 0, 0))
+
+
+def test_double_spend_within_block_is_rejected(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    assert not submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)]),
+                                              spend([deposit_id], [ALICE], [(ALICE.address, NULL_ADDRESS, 100)])])
+    assert not submit(child_chain, OPERATOR, [spend([deposit_id, deposit_id], [ALICE, ALICE], [(BOB.address, NULL_ADDRESS, 200)])])
+
+    assert not child_chain.is_spent(deposit_id)
+    assert child_chain.next_child_block == 1000
+
+
+def test_failed_block_store_write_rolls_back_utxos(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+
+    class FailingBlockStore(dict):
+        def __setitem__(self, blknum, block):
+            raise IOError('disk full')
+
+    child_chain.blocks = FailingBlockStore(child_chain.blocks)
+    with pytest.raises(IOError):
+        submit(child_chain, OPERATOR, [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])])
+
+    assert set(child_chain.utxos.get_by_owner(ALICE.address)) == {deposit_id}
+    assert child_chain.utxos.get_by_owner(BOB.address) == {}
+    assert child_chain.next_child_block == 1000
+
+
+def test_signers_of_added_block_are_not_cached(child_chain):
+    deposit_id = deposit(child_chain, ALICE, 100)
+    tx = spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)])
+    child_chain.validate_transaction(tx)
+    assert (tx.hash, 0) in child_chain._signers
+
+    assert submit(child_chain, OPERATOR, [tx])
+
+    assert len(child_chain._signers) == 0
+
+
+def test_signer_cache_is_bounded():
+    child_chain = ChildChain(OPERATOR, verifying_contract=VerifyingContract, max_cached_signers=2)
+    deposit_ids = [deposit(child_chain, ALICE, 100) for _ in range(3)]
+    txs = [spend([deposit_id], [ALICE], [(BOB.address, NULL_ADDRESS, 100)]) for deposit_id in deposit_ids]
+
+    child_chain.recover_signers(txs[:2])
+    assert child_chain.get_signer(txs[0], 0) == ALICE.key.public_key.to_canonical_address()
+    child_chain.recover_signers(txs[2:])
+
+    assert list(child_chain._signers) == [(txs[0].hash, 0), (txs[2].hash, 0)]
+    assert child_chain.get_signer(txs[1], 0) == ALICE.key.public_key.to_canonical_address()
+
+
+def test_block_is_validated_with_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        child_chain = ChildChain(OPERATOR, verifying_contract=VerifyingContract, executor=executor)
+        deposit_ids = [deposit(child_chain, owner, 100) for owner in (ALICE, BOB, ALICE, BOB)]
+        txs = [spend([deposit_id], [owner], [(OPERATOR.address, NULL_ADDRESS, 100)])
+               for deposit_id, owner in zip(deposit_ids, (ALICE, BOB, ALICE, BOB))]
+
+        assert submit(child_chain, OPERATOR, txs)
+
+    assert set(child_chain.utxos.get_by_owner(OPERATOR.address)) == {encode_utxo_id(1000, i, 0) for i in range(4)}
+
+
+def test_block_with_mismatched_signatures_is_rejected(child_chain):
+    deposit_ids = [deposit(child_chain, ALICE, 100), deposit(child_chain, BOB, 100)]
+    block = Block([spend([deposit_ids[0]], [ALICE], [(BOB.address, NULL_ADDRESS, 100)]),
+                   spend([deposit_ids[1]], [BOB], [(ALICE.address, NULL_ADDRESS, 100)])],
+                  number=child_chain.next_child_block).sign(OPERATOR.key)
+
+    # as received over the wire, with signatures of the two transactions swapped
+    wire_block = decode_block_record(encode_block_record(block))
+    first, second = wire_block.transactions
+    first.signatures, second.signatures = second.signatures, first.signatures
+
+    assert not child_chain.add_block(wire_block)
+    assert not any(child_chain.is_spent(deposit_id) for deposit_id in deposit_ids)
+    assert child_chain.add_block(decode_block_record(encode_block_record(block)))
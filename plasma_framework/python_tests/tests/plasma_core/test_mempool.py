@@ -0,0 +1,167 @@
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.child_chain import ChildChain
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.exceptions import DepositTxException, InvalidTxSignatureException, TxAlreadySpentException
+from plasma_core.mempool import Mempool
+from plasma_core.transaction import Transaction
+from plasma_core.utils.transactions import decode_utxo_id, encode_utxo_id
+from tests.tests_utils.plasma_core import ALICE, BOB, OPERATOR, VerifyingContract
+
+
+class Clock:
+    now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def child_chain():
+    child_chain = ChildChain(OPERATOR, verifying_contract=VerifyingContract)
+    for blknum in range(1, 4):
+        child_chain.add_block(Block([Transaction(outputs=[(ALICE.address, NULL_ADDRESS, 100)])], number=blknum))
+    return child_chain
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def mempool(child_chain, clock):
+    return Mempool(child_chain, max_block_size=2, max_block_age=10, clock=clock)
+
+
+def spend(blknum, owner, new_owner, amount=100):
+    tx = Transaction(inputs=[decode_utxo_id(encode_utxo_id(blknum, 0, 0))], outputs=[(new_owner.address, NULL_ADDRESS, amount)])
+    tx.sign(0, owner, verifying_contract=VerifyingContract)
+    return tx
+
+
+def test_block_is_cut_when_full(mempool, child_chain):
+    txs = [spend(blknum, ALICE, BOB) for blknum in range(1, 4)]
+    mempool.add(txs[0])
+    assert mempool.poll() is None
+    mempool.add(txs[1])
+    mempool.add(txs[2])
+
+    block = mempool.poll()
+
+    assert [tx.hash for tx in block.transactions] == [txs[0].hash, txs[1].hash]
+    assert block.number == 1000
+    assert len(mempool) == 1 and txs[2].hash in mempool
+    assert child_chain.add_block(block.sign(OPERATOR.key))
+
+
+def test_block_is_cut_when_old_enough(mempool, clock):
+    mempool.add(spend(1, ALICE, BOB))
+    clock.now = 9
+    assert not mempool.is_block_ready()
+
+    clock.now = 10
+    assert len(mempool.poll().transactions) == 1
+    assert not mempool.is_block_ready()
+
+
+def test_next_block_root(mempool):
+    txs = [spend(blknum, ALICE, BOB) for blknum in range(1, 4)]
+    assert mempool.next_block_root == Block().root
+
+    for tx in txs:
+        mempool.add(tx)
+    assert mempool.next_block_root == Block(txs[:2]).root
+
+    mempool.remove(txs[0].hash)
+    assert mempool.next_block_root == Block(txs[1:]).root
+
+
+def test_pending_spend_is_rejected(mempool):
+    mempool.add(spend(1, ALICE, BOB))
+
+    with pytest.raises(TxAlreadySpentException):
+        mempool.add(spend(1, ALICE, ALICE))
+    assert len(mempool) == 1
+
+
+def test_invalid_transactions_are_rejected(mempool):
+    with pytest.raises(InvalidTxSignatureException):
+        mempool.add(spend(1, BOB, BOB))
+    with pytest.raises(DepositTxException):
+        mempool.add(Transaction(outputs=[(BOB.address, NULL_ADDRESS, 100)]))
+    assert len(mempool) == 0
+
+
+def test_transactions_spent_on_chain_are_evicted(mempool, child_chain):
+    block = Block([spend(1, ALICE, BOB)], number=1000).sign(OPERATOR.key)
+    mempool.add(spend(1, ALICE, ALICE))
+    mempool.add(spend(2, ALICE, ALICE))
+
+    assert child_chain.add_block(block)
+    evicted = mempool.evict_spent()
+
+    assert len(evicted) == 1 and evicted[0] not in mempool
+    assert len(mempool) == 1
+    mempool.add(spend(3, ALICE, BOB))
+
+
+def test_inputs_of_cut_block_stay_reserved(mempool, child_chain):
+    mempool.add(spend(1, ALICE, BOB))
+    first = mempool.cut_block()
+
+    with pytest.raises(TxAlreadySpentException):
+        mempool.add(spend(1, ALICE, ALICE))
+    mempool.add(spend(2, ALICE, BOB))
+    mempool.add(spend(3, ALICE, BOB))
+    second = mempool.cut_block()
+
+    assert second.number == 2000
+    assert child_chain.add_block(first.sign(OPERATOR.key))
+    mempool.confirm_block(first)
+    assert child_chain.add_block(second.sign(OPERATOR.key))
+    mempool.confirm_block(second)
+    assert mempool._spent == {}
+
+
+def test_abandoned_block_returns_to_pool(mempool):
+    txs = [spend(blknum, ALICE, BOB) for blknum in range(1, 4)]
+    for tx in txs:
+        mempool.add(tx)
+    first = mempool.cut_block()
+    second = mempool.cut_block()
+
+    mempool.abandon_block(first)
+
+    assert len(mempool) == 3
+    assert [tx.hash for tx in mempool.cut_block().transactions] == [txs[0].hash, txs[1].hash]
+    assert second.number == 2000
+
+
+def test_submit_block(mempool, child_chain):
+    mempool.add(spend(1, ALICE, BOB))
+
+    assert mempool.submit_block(OPERATOR.key).number == 1000
+    assert set(child_chain.utxos.get_by_owner(BOB.address)) == {encode_utxo_id(1000, 0, 0)}
+    assert len(mempool) == 0
+
+    mempool.add(spend(2, ALICE, BOB))
+    assert mempool.submit_block(BOB.key) is None
+    assert len(mempool) == 1
+
+
+def test_transactions_spent_by_other_block_are_evicted_on_cut(mempool, child_chain):
+    mempool.add(spend(1, ALICE, ALICE))
+    mempool.add(spend(2, ALICE, ALICE))
+    assert child_chain.add_block(Block([spend(1, ALICE, BOB)], number=1000).sign(OPERATOR.key))
+
+    block = mempool.cut_block()
+
+    assert [tx.inputs[0].blknum for tx in block.transactions] == [2]
+    assert child_chain.add_block(block.sign(OPERATOR.key))
+
+
+def test_max_block_size_is_bounded(child_chain):
+    with pytest.raises(ValueError):
+        Mempool(child_chain, max_block_size=2 ** 16 + 1)
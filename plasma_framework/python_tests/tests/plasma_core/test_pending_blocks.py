@@ -0,0 +1,65 @@
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.pending_blocks import PendingBlocks
+
+
+def test_pop_returns_blocks_in_order_of_arrival():
+    pending_blocks = PendingBlocks()
+    first, second = Block(number=2000), Block(number=2000)
+    pending_blocks.add(first)
+    pending_blocks.add(second)
+
+    assert 2000 in pending_blocks
+    assert pending_blocks.pop(2000) is first
+    assert pending_blocks.pop(2000) is second
+    assert pending_blocks.pop(2000) is None
+    assert 2000 not in pending_blocks
+    assert len(pending_blocks) == 0
+
+
+def test_iterates_in_block_number_order():
+    pending_blocks = PendingBlocks()
+    blocks = [Block(number=number) for number in (3000, 1001, 2000)]
+    for block in blocks:
+        pending_blocks.add(block)
+
+    assert [block.number for block in pending_blocks] == [1001, 2000, 3000]
+
+
+def test_drop_below():
+    pending_blocks = PendingBlocks()
+    for number in (1001, 1002, 2000, 3000):
+        pending_blocks.add(Block(number=number))
+
+    pending_blocks.drop_below(2000)
+
+    assert len(pending_blocks) == 2
+    assert [block.number for block in pending_blocks] == [2000, 3000]
+
+
+def test_drop_below_after_pop():
+    pending_blocks = PendingBlocks()
+    pending_blocks.add(Block(number=1000))
+    pending_blocks.pop(1000)
+    pending_blocks.add(Block(number=1000))
+
+    pending_blocks.drop_below(2000)
+
+    assert len(pending_blocks) == 0
+    assert list(pending_blocks) == []
+
+
+def test_full_buffer_evicts_furthest_block():
+    pending_blocks = PendingBlocks(max_size=2)
+    pending_blocks.add(Block(number=2000))
+    pending_blocks.add(Block(number=4000))
+
+    assert pending_blocks.add(Block(number=3000))
+    assert not pending_blocks.add(Block(number=5000))
+    assert [block.number for block in pending_blocks] == [2000, 3000]
+
+
+def test_max_size_must_be_positive():
+    with pytest.raises(ValueError):
+        PendingBlocks(max_size=0)
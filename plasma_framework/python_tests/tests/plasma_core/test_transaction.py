@@ -0,0 +1,108 @@
+import copy
+import pickle
+
+import rlp
+
+import plasma_core.transaction
+from plasma_core.block import Block
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction, TransactionInput, TransactionOutput
+from tests.tests_utils.plasma_core import ALICE, OWNER, VerifyingContract
+
+token = bytes.fromhex('0123456789abcdef000000000000000000000000')
+metadata = bytes.fromhex('853a8d8af99c93405a791b97d57e819e538b06ffaa32ad70da2582500bc18d43')
+
+
+def test_input_position():
+    tx_input = TransactionInput(1000, 2, 3)
+    assert (tx_input.blknum, tx_input.txindex, tx_input.oindex) == (1000, 2, 3)
+    assert tx_input.identifier == 1000 * 1000000000 + 2 * 10000 + 3
+    assert TransactionInput.from_utxo_id(tx_input.utxo_id) == tx_input
+
+
+def test_output_canonicalizes_addresses():
+    output = TransactionOutput(OWNER, NULL_ADDRESS, 100)
+    assert output.output_guard == bytes.fromhex(OWNER[2:])
+    assert output == TransactionOutput(bytes.fromhex(OWNER[2:]), NULL_ADDRESS, 100)
+
+
+def test_pickle_round_trip():
+    tx = Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata)
+
+    assert copy.deepcopy(tx.outputs[0]) == tx.outputs[0]
+    unpickled = pickle.loads(pickle.dumps(tx))
+    assert unpickled == tx
+    assert unpickled.encoded == tx.encoded
+
+
+def test_decode_transaction():
+    tx = Transaction(inputs=[(1, 0, 0), (1000, 2, 3)],
+                     outputs=[(OWNER, NULL_ADDRESS, 100), (OWNER, token, 1337)],
+                     metadata=metadata)
+
+    decoded = Transaction.decode(tx.encoded)
+
+    assert decoded == tx
+    assert decoded.encoded == tx.encoded
+    assert decoded.hash_struct() == tx.hash_struct()
+    assert [i.identifier for i in decoded.inputs] == [i.identifier for i in tx.inputs]
+
+
+def test_decode_block():
+    block = Block([Transaction(outputs=[(OWNER, NULL_ADDRESS, 100)]), Transaction(inputs=[(1, 0, 0)])], number=1000)
+
+    decoded = rlp.decode(block.encoded, Block)
+
+    assert decoded.number == block.number
+    assert decoded.root == block.root
+
+
+class OtherContract:
+    address = '0x1111111111111111111111111111111111111111'
+
+
+def count_calls(monkeypatch, target, name):
+    calls = []
+    function = getattr(target, name)
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(target, name, counting)
+    return calls
+
+
+def test_encoding_and_hashes_are_computed_once(monkeypatch):
+    encode_calls = count_calls(monkeypatch, plasma_core.transaction.rlp, 'encode')
+    keccak_calls = count_calls(monkeypatch, plasma_core.transaction, 'keccak')
+    hash_struct_calls = count_calls(monkeypatch, plasma_core.transaction, 'hash_struct')
+    tx = Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata)
+
+    for _ in range(3):
+        assert tx.encoded == tx.encoded
+        assert tx.hash == tx.hash
+        assert tx.hash_struct(VerifyingContract) == tx.hash_struct(VerifyingContract)
+
+    assert (len(encode_calls), len(keccak_calls), len(hash_struct_calls)) == (1, 1, 1)
+
+
+def test_signing_keeps_encoding_and_hash():
+    tx = Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata)
+    encoded, tx_hash, struct_hash = tx.encoded, tx.hash, tx.hash_struct(VerifyingContract)
+
+    tx.sign(0, ALICE, verifying_contract=VerifyingContract)
+
+    assert (tx.encoded, tx.hash, tx.hash_struct(VerifyingContract)) == (encoded, tx_hash, struct_hash)
+    assert tx.encoded == Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata).encoded
+
+
+def test_struct_hashes_are_kept_per_verifying_contract():
+    tx = Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata)
+    fresh = Transaction(inputs=[(1000, 2, 3)], outputs=[(OWNER, token, 1337)], metadata=metadata)
+
+    struct_hashes = [tx.hash_struct(), tx.hash_struct(VerifyingContract), tx.hash_struct(OtherContract)]
+
+    assert len(set(struct_hashes)) == 3
+    assert [tx.hash_struct(), tx.hash_struct(VerifyingContract), tx.hash_struct(OtherContract)] == struct_hashes
+    assert [fresh.hash_struct(OtherContract), fresh.hash_struct(VerifyingContract), fresh.hash_struct()] == struct_hashes[::-1]
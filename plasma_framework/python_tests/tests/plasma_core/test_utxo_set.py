@@ -0,0 +1,69 @@
+import pytest
+
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import TransactionOutput
+from plasma_core.utxo_set import UtxoSet
+
+alice = '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1'
+bob = bytes.fromhex('2258a5279850f6fb78888a7e45ea2a5eb1b3c436')
+token = bytes.fromhex('0123456789abcdef000000000000000000000000')
+
+
+@pytest.fixture
+def utxo_set():
+    utxos = UtxoSet()
+    utxos.add(1000000000, TransactionOutput(alice, NULL_ADDRESS, 100))
+    utxos.add(1000000001, TransactionOutput(bob, token, 200))
+    utxos.add(2000000000, TransactionOutput(alice, token, 300))
+    return utxos
+
+
+def test_lookup(utxo_set):
+    assert len(utxo_set) == 3
+    assert 1000000001 in utxo_set
+    assert utxo_set.get(1000000001).amount == 200
+    assert utxo_set.get(3000000000) is None
+
+
+def test_get_by_owner(utxo_set):
+    assert set(utxo_set.get_by_owner(alice)) == {1000000000, 2000000000}
+    assert set(utxo_set.get_by_owner(bob)) == {1000000001}
+
+
+def test_get_by_token(utxo_set):
+    assert set(utxo_set.get_by_token(token)) == {1000000001, 2000000000}
+    assert set(utxo_set.get_by_token(NULL_ADDRESS)) == {1000000000}
+
+
+def test_remove(utxo_set):
+    utxo_set.remove(2000000000)
+    assert 2000000000 not in utxo_set
+    assert set(utxo_set.get_by_owner(alice)) == {1000000000}
+    assert set(utxo_set.get_by_token(token)) == {1000000001}
+
+    utxo_set.remove(1000000001)
+    assert utxo_set.get_by_owner(bob) == {}
+
+
+def test_apply(utxo_set):
+    removed = utxo_set.apply([1000000000, 2000000000], [(3000000000, TransactionOutput(bob, NULL_ADDRESS, 400))])
+
+    assert set(removed) == {(1000000000, TransactionOutput(alice, NULL_ADDRESS, 100)),
+                            (2000000000, TransactionOutput(alice, token, 300))}
+    assert set(utxo_set.utxos) == {1000000001, 3000000000}
+    assert utxo_set.get_by_owner(alice) == {}
+
+
+@pytest.mark.parametrize('spent,created', [
+    ([1000000000, 3000000000], []),
+    ([1000000000, 1000000000], []),
+    ([1000000000], [(2000000000, TransactionOutput(bob, NULL_ADDRESS, 1))]),
+])
+def test_conflicting_apply_leaves_set_untouched(utxo_set, spent, created):
+    before = dict(utxo_set.utxos)
+
+    with pytest.raises(KeyError):
+        utxo_set.apply(spent, created)
+
+    assert utxo_set.utxos == before
+    assert set(utxo_set.get_by_owner(alice)) == {1000000000, 2000000000}
@@ -0,0 +1,114 @@
+import threading
+
+import requests
+from eth_utils import to_bytes
+from web3 import HTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde
+
+
+class _PendingRequest:
+    def __init__(self, rpc_request):
+        self.rpc_request = rpc_request
+        self.response = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """ HTTP provider which sends concurrent read requests together, as a JSON-RPC batch.
+
+        Reads made while a batch is on its way to the node are queued, and whichever thread queued first
+        sends them all in the next batch. A single thread therefore never waits for a batch to fill up.
+        Requests that change the state of the node are sent on their own, in the order they are made.
+
+        All requests go through one keep-alive session.
+    """
+
+    READ_METHODS = frozenset([
+        'eth_blockNumber',
+        'eth_call',
+        'eth_chainId',
+        'eth_estimateGas',
+        'eth_gasPrice',
+        'eth_getBalance',
+        'eth_getBlockByHash',
+        'eth_getBlockByNumber',
+        'eth_getCode',
+        'eth_getLogs',
+        'eth_getStorageAt',
+        'eth_getTransactionByHash',
+        'eth_getTransactionCount',
+        'eth_getTransactionReceipt',
+        'net_version',
+        'web3_clientVersion',
+    ])
+
+    def __init__(self, endpoint_uri=None, request_kwargs=None, max_batch_size=100):
+        super().__init__(endpoint_uri, request_kwargs)
+        self.max_batch_size = max_batch_size
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._queue = []
+        self._sending = False
+
+    def make_request(self, method, params):
+        if method not in self.READ_METHODS:
+            return self.decode_rpc_response(self._post(self.encode_rpc_request(method, params)))
+
+        request = _PendingRequest({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        })
+        with self._lock:
+            self._queue.append(request)
+            leader = not self._sending
+            self._sending = True
+
+        if leader:
+            self._send_queued()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def _send_queued(self):
+        while True:
+            with self._lock:
+                batch = self._queue[:self.max_batch_size]
+                del self._queue[:self.max_batch_size]
+                if not batch:
+                    self._sending = False
+                    return
+
+            try:
+                self._send_batch(batch)
+            except Exception as error:
+                for request in batch:
+                    request.error = error
+            finally:
+                for request in batch:
+                    request.done.set()
+
+    def _send_batch(self, batch):
+        if len(batch) == 1:
+            (request,) = batch
+            request.response = self.decode_rpc_response(self._post(self._encode(request.rpc_request)))
+            return
+
+        responses = self.decode_rpc_response(self._post(self._encode([request.rpc_request for request in batch])))
+        responses_by_id = {response['id']: response for response in responses}
+        for request in batch:
+            request.response = responses_by_id[request.rpc_request['id']]
+
+    @staticmethod
+    def _encode(payload):
+        return to_bytes(text=FriendlyJsonSerde().json_encode(payload))
+
+    def _post(self, data):
+        kwargs = self.get_request_kwargs()
+        kwargs.setdefault('timeout', 10)
+        response = self._session.post(self.endpoint_uri, data=data, **kwargs)
+        response.raise_for_status()
+        return response.content
@@ -1,7 +1,10 @@
+import threading
+
 from eth_tester.exceptions import TransactionFailed
 from web3 import eth
 from web3._utils.datatypes import PropertyCheckingFactory
 from web3.contract import Contract
+from web3.exceptions import TransactionNotFound
 
 
 class AutominingEth(eth.Eth):
@@ -9,6 +12,10 @@ class AutominingEth(eth.Eth):
         so that mining transactions is automatic yet deterministic.
 
         Provides methods for control of mining and time forwarding.
+
+        Sending a transaction and mining it happen under a lock, so when transactions are sent
+        from many threads, each of them is mined in a block of its own and its failure is reported
+        to the thread that sent it.
     """
 
     def __init__(self, web3):
@@ -16,6 +23,7 @@ class AutominingEth(eth.Eth):
         self._mine = True
         self._next_timestamp = None
         self._last_tx_hash = None
+        self._lock = threading.RLock()
 
     def disable_auto_mine(self):
         self._mine = False
@@ -23,7 +31,15 @@ class AutominingEth(eth.Eth):
     def enable_auto_mine(self):
         self._mine = True
 
+    @property
+    def auto_mine(self):
+        return self._mine
+
     def mine(self, timestamp=None, expect_error=False):
+        with self._lock:
+            self._mine_block(timestamp, expect_error)
+
+    def _mine_block(self, timestamp, expect_error):
         timestamp = timestamp or self._get_next_timestamp()
         try:
             result = self.web3.manager.request_blocking('evm_mine', [timestamp])
@@ -38,14 +54,16 @@ class AutominingEth(eth.Eth):
             raise error
 
     def increase_time(self, seconds):
-        self._next_timestamp = self.getBlock('latest')['timestamp'] + seconds
+        with self._lock:
+            self._next_timestamp = self.getBlock('latest')['timestamp'] + seconds
 
     def sendTransaction(self, transaction):
-        tx_hash = super().sendTransaction(transaction)
-        if self._mine:
-            self.mine()
+        with self._lock:
+            tx_hash = super().sendTransaction(transaction)
+            if self._mine:
+                self.mine()
 
-        self._last_tx_hash = tx_hash
+            self._last_tx_hash = tx_hash
         return tx_hash
 
     @property
@@ -72,24 +90,31 @@ class ConvenienceContractWrapper:
     # at gas estimation when the transaction being estimated fails.
     default_params = {'gasPrice': 0, 'gas': 4 * 10 ** 6}
 
-    def __init__(self, contract: Contract):
+    def __init__(self, contract: Contract, pipeline=None):
         self.contract = contract
+        self.pipeline = pipeline
 
     def __getattr__(self, item):
         method = self._find_abi_method(item)
         if method:
             function = self.contract.functions.__getattribute__(item)
-            return ConvenienceContractWrapper._call_or_transact(function, method)
+            return ConvenienceContractWrapper._call_or_transact(function, method, self.pipeline)
 
         return self.contract.__getattribute__(item)
 
+    def pipelined(self, pipeline):
+        """Returns a wrapper of the same contract which sends transactions through the pipeline,
+        see `TransactionPipeline`.
+        """
+        return ConvenienceContractWrapper(self.contract, pipeline)
+
     def _find_abi_method(self, item):
         for i in self.contract.abi:
             if i['type'] == 'function' and i['name'] == item:
                 return i
 
     @staticmethod
-    def _call_or_transact(function, method_abi):
+    def _call_or_transact(function, method_abi, pipeline=None):
         def _do_call(*args):
             try:
                 result = function(*args).call()
@@ -99,6 +124,8 @@ class ConvenienceContractWrapper:
 
         def _do_transact(*args, **kwargs):
             params = {**ConvenienceContractWrapper.default_params, **kwargs}
+            if pipeline is not None:
+                return pipeline.transact(function(*args), params)
 
             tx_hash = function(*args).transact(params)
             receipt = function.web3.eth.waitForTransactionReceipt(tx_hash)
@@ -119,3 +146,69 @@ class ConvenienceContractWrapper:
             if isinstance(attr, PropertyCheckingFactory):
                 contract_events.append(attr)
         return contract_events
+
+
+class TransactionPipeline:
+    """ Sends transactions without waiting for them to be mined.
+
+        Nonces are allocated locally for every sender, so transactions can be sent back to back.
+        Receipts are fetched, and their statuses checked, only on `flush()`.
+
+        Usage:
+            pipeline = TransactionPipeline(w3)
+            token.pipelined(pipeline).mint(owner.address, amount)
+            ...
+            pipeline.flush()
+    """
+
+    def __init__(self, web3):
+        self.web3 = web3
+        self._nonces = dict()
+        self._tx_hashes = []
+
+    def transact(self, function_call, params):
+        sender = params.get('from', self.web3.eth.defaultAccount)
+        nonce = self._nonces.get(sender)
+        if nonce is None:
+            nonce = self.web3.eth.getTransactionCount(sender, 'pending')
+
+        try:
+            tx_hash = function_call.transact({**params, 'from': sender, 'nonce': nonce})
+        except Exception:
+            # the node might not have taken the nonce, ask for it again next time
+            self._nonces.pop(sender, None)
+            raise
+
+        self._nonces[sender] = nonce + 1
+        self._tx_hashes.append(tx_hash)
+        return tx_hash
+
+    def flush(self, timeout=120):
+        """ Waits for all the transactions sent so far.
+
+            Returns their receipts, in order. Raises TransactionFailed if any of them failed,
+            and web3.exceptions.TimeExhausted if any of them is not mined within `timeout` seconds.
+        """
+        tx_hashes, self._tx_hashes = self._tx_hashes, []
+        receipts = [self._get_receipt(tx_hash) for tx_hash in tx_hashes]
+        if isinstance(self.web3.eth, AutominingEth) and not self.web3.eth.auto_mine:
+            # mine the transactions still pending, a block fits only so many of them.
+            # Every block takes at least one of them, unless the rest can not be mined, e.g. behind a nonce gap.
+            for _ in range(len(tx_hashes)):
+                if None not in receipts:
+                    break
+                self.web3.eth.mine()
+                receipts = [receipt or self._get_receipt(tx_hash) for tx_hash, receipt in zip(tx_hashes, receipts)]
+        receipts = [receipt or self.web3.eth.waitForTransactionReceipt(tx_hash, timeout)
+                    for tx_hash, receipt in zip(tx_hashes, receipts)]
+
+        failed = [receipt.transactionHash for receipt in receipts if receipt.status == 0]
+        if failed:
+            raise TransactionFailed(failed)
+        return receipts
+
+    def _get_receipt(self, tx_hash):
+        try:
+            return self.web3.eth.getTransactionReceipt(tx_hash)
+        except TransactionNotFound:
+            return None
@@ -0,0 +1,33 @@
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.account import EthereumAccount
+from plasma_core.block import Block
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+
+OWNER = '0x82a978b3f5962a5b0957d9ee9eef472ee55b42f1'
+
+
+class VerifyingContract:
+    """Stands in for the deployed contract transactions are signed for, in tests that run without a root chain"""
+    address = '0x44de0ec539b8c4a4b530c78620fe8320167f2f74'
+
+
+def make_accounts(count):
+    """Returns accounts with the keys of the session `accounts` fixture, which is only available with a running node"""
+    keys = [PrivateKey(i.to_bytes(32, byteorder='big')) for i in range(1, count + 1)]
+    return [EthereumAccount(key.public_key.to_checksum_address(), key) for key in keys]
+
+
+ACCOUNTS = make_accounts(3)
+OPERATOR, ALICE, BOB = ACCOUNTS
+
+
+def make_transactions(count, blknum=1000):
+    """Returns transactions spending outputs of block `blknum`, the i-th of them paying i to `OWNER`"""
+    return [Transaction(inputs=[(blknum, i, 0)], outputs=[(OWNER, NULL_ADDRESS, i)]) for i in range(count)]
+
+
+def make_block(number, tx_count):
+    """Returns an unsigned block of `make_transactions`, spending outputs of a block with the same number"""
+    return Block(make_transactions(tx_count, number), number=number)
@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tests.tests_utils.batching_provider import BatchingHTTPProvider
+
+
+class RpcServer(ThreadingHTTPServer):
+    """Answers every request with its method name, recording the payloads it received"""
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, delay=None):
+        super().__init__(('127.0.0.1', 0), RpcHandler)
+        self.payloads = []
+        self.delay = delay
+
+
+class RpcHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.payloads.append(payload)
+        if self.server.delay is not None:
+            self.server.delay.wait()
+
+        if isinstance(payload, list):
+            response = [self._respond(request) for request in reversed(payload)]
+        else:
+            response = self._respond(payload)
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+    @staticmethod
+    def _respond(request):
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': request['method']}
+
+
+@pytest.fixture
+def server():
+    server = RpcServer(delay=threading.Event())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.delay.set()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def provider(server):
+    provider = BatchingHTTPProvider(f'http://127.0.0.1:{server.server_port}')
+    yield provider
+    provider._session.close()
+
+
+def test_single_request_is_not_batched(server, provider):
+    server.delay.set()
+
+    assert provider.make_request('eth_getBalance', ['0x0', 'latest'])['result'] == 'eth_getBalance'
+    assert provider.make_request('eth_sendTransaction', [{}])['result'] == 'eth_sendTransaction'
+    assert all(isinstance(payload, dict) for payload in server.payloads)
+
+
+def test_concurrent_reads_are_batched(server, provider):
+    methods = ['eth_call', 'eth_getBalance', 'eth_getTransactionReceipt', 'eth_blockNumber'] * 5
+
+    with ThreadPoolExecutor(max_workers=len(methods) + 1) as executor:
+        first = executor.submit(provider.make_request, 'eth_blockNumber', [])
+        # the rest of the reads are queued while the first one is being answered
+        while not server.payloads:
+            time.sleep(0.001)
+        rest = [executor.submit(provider.make_request, method, []) for method in methods]
+        while len(provider._queue) < len(methods):
+            time.sleep(0.001)
+        server.delay.set()
+
+        assert first.result()['result'] == 'eth_blockNumber'
+        assert [future.result()['result'] for future in rest] == methods
+
+    assert len(server.payloads) == 2
+    assert len(server.payloads[1]) == len(methods)
+
+
+def test_failed_batch_is_reported_to_every_request(provider):
+    provider.endpoint_uri = 'http://127.0.0.1:1'
+
+    with pytest.raises(IOError):
+        provider.make_request('eth_call', [])
+    assert not provider._sending
@@ -0,0 +1,30 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.utils.merkle.block_roots import compute_block_roots
+from tests.tests_utils.plasma_core import make_block
+
+
+@pytest.fixture
+def blocks():
+    return [make_block(blknum * 1000, blknum % 7) for blknum in range(1, 30)]
+
+
+def test_compute_block_roots(blocks):
+    roots = compute_block_roots([tx.encoded for tx in block.transactions] for block in blocks)
+    assert roots == [block.root for block in blocks]
+
+
+@pytest.mark.parametrize('executor_type', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_compute_block_roots_in_parallel(blocks, executor_type):
+    with executor_type(max_workers=2) as executor:
+        roots = compute_block_roots([[tx.encoded for tx in block.transactions] for block in blocks], executor=executor)
+    assert roots == [block.root for block in blocks]
+
+
+def test_compute_roots_of_empty_blocks():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert compute_block_roots([[], []], executor=executor) == [Block().root] * 2
+        assert compute_block_roots([], executor=executor) == []
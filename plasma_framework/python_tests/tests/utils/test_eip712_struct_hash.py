@@ -0,0 +1,95 @@
+import pytest
+from eip712_structs import EIP712Struct, Address, Uint, Bytes, make_domain
+from eth_utils import keccak
+
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.eip712_struct_hash import hash_struct
+from tests.tests_utils.plasma_core import VerifyingContract
+
+
+# Reference implementation built with eip712_structs, the fast hasher must produce the same hashes
+
+class Input(EIP712Struct):
+    blknum = Uint(256)
+    txindex = Uint(256)
+    oindex = Uint(256)
+
+
+class Output(EIP712Struct):
+    outputType = Uint(256)
+    outputGuard = Bytes(20)
+    currency = Address()
+    amount = Uint(256)
+
+
+class StructTransaction(EIP712Struct):
+    txType = Uint(256)
+    input0 = Input
+    input1 = Input
+    input2 = Input
+    input3 = Input
+    output0 = Output
+    output1 = Output
+    output2 = Output
+    output3 = Output
+    metadata = Bytes(32)
+
+
+StructTransaction.type_name = 'Transaction'
+
+
+def reference_hash_struct(tx, domain):
+    inputs = [Input(blknum=i.blknum, txindex=i.txindex, oindex=i.oindex) for i in tx.inputs]
+    inputs += [Input()] * (4 - len(inputs))
+    outputs = [Output(outputType=o.output_type, outputGuard=o.output_guard, currency=o.token, amount=o.amount)
+               for o in tx.outputs]
+    outputs += [Output()] * (4 - len(outputs))
+    struct_tx = StructTransaction(txType=tx.tx_type,
+                                  input0=inputs[0], input1=inputs[1], input2=inputs[2], input3=inputs[3],
+                                  output0=outputs[0], output1=outputs[1], output2=outputs[2], output3=outputs[3],
+                                  metadata=tx.metadata)
+    return keccak(b'\x19\x01' + domain.hash_struct() + struct_tx.hash_struct())
+
+
+def make_test_domain(verifying_address):
+    return make_domain(
+        name='OMG Network',
+        version='1',
+        verifyingContract=verifying_address,
+        salt=bytes.fromhex('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83')
+    )
+
+
+owner = bytes.fromhex('2258a5279850f6fb78888a7e45ea2a5eb1b3c436')
+token = bytes.fromhex('0123456789abcdef000000000000000000000000')
+metadata = bytes.fromhex('853a8d8af99c93405a791b97d57e819e538b06ffaa32ad70da2582500bc18d43')
+
+transactions = [
+    Transaction(),
+    Transaction(inputs=[(1, 0, 0), (1000, 2, 3), (101000, 1337, 3)],
+                outputs=[(owner, NULL_ADDRESS, 100), (token, NULL_ADDRESS, 111), (owner, token, 1337)]),
+    Transaction(inputs=[(1, 0, 0)] * 4, outputs=[(owner, token, 2 ** 200)] * 4, metadata=metadata),
+]
+
+
+@pytest.mark.parametrize("tx", transactions)
+def test_hash_with_verifying_contract(tx):
+    expected = reference_hash_struct(tx, make_test_domain(bytes.fromhex(VerifyingContract.address[2:])))
+    assert hash_struct(tx, verifying_contract=VerifyingContract) == expected
+
+
+@pytest.mark.parametrize("tx", transactions)
+def test_hash_without_verifying_contract(tx):
+    assert hash_struct(tx) == reference_hash_struct(tx, make_test_domain(NULL_ADDRESS))
+
+
+@pytest.mark.parametrize("tx", transactions)
+def test_hash_with_domain(tx):
+    domain = make_test_domain(owner)
+    assert hash_struct(tx, domain) == reference_hash_struct(tx, domain)
+
+
+def test_domain_and_verifying_contract_are_exclusive():
+    with pytest.raises(RuntimeError):
+        hash_struct(Transaction(), make_test_domain(owner), VerifyingContract)
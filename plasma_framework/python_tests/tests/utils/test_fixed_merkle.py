@@ -2,7 +2,8 @@ import math
 import pytest
 from eth_utils import keccak as sha3
 
-from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.exceptions import MemberNotExistException
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle, zero_hashes
 from plasma_core.constants import NULL_HASH
 
 
@@ -55,3 +56,51 @@ def test_check_membership():
     merkle = FixedMerkle(2, leaves)
     proof = merkle.create_membership_proof(leaves[2])
     assert merkle.check_membership(leaves[2], 2, proof)
+
+
+def test_membership_proofs_for_all_leaves():
+    leaves = [b'a', b'b', b'c', b'd', b'e']
+    merkle = FixedMerkle(3, leaves)
+    for index, leaf in enumerate(leaves):
+        proof = merkle.create_membership_proof(leaf)
+        assert merkle.check_membership(leaf, index, proof)
+
+
+def test_create_membership_proof_of_non_member():
+    merkle = FixedMerkle(2, [b'a'])
+    with pytest.raises(MemberNotExistException):
+        merkle.create_membership_proof(b'b')
+
+
+@pytest.mark.parametrize("depth", [1, 2, 16])
+def test_zero_hashes(depth):
+    assert zero_hashes(depth) == [get_empty_tree_hash(height) for height in range(depth + 1)]
+
+
+def test_sparse_tree_matches_padded_tree():
+    leaves = [b'a', b'b', b'c']
+    padded_root = FixedMerkle(2, leaves + [NULL_HASH]).root
+    merkle = FixedMerkle(2, leaves)
+    assert merkle.root == padded_root
+    assert merkle.create_membership_proof(NULL_HASH) == sha3(leaves[2]) + sha3(sha3(leaves[0]) + sha3(leaves[1]))
+
+
+def test_proofs_for_all():
+    leaves = [b'a', b'b', b'c', b'd', b'e']
+    merkle = FixedMerkle(3, leaves)
+    proofs = merkle.proofs_for_all()
+    assert [bytes(proof) for proof in proofs] == [merkle.create_membership_proof(leaf) for leaf in leaves]
+
+
+def test_proofs_for_indices():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(16, leaves)
+    proofs = merkle.proofs_for([2, 0, 3])
+    assert bytes(proofs[0]) == merkle.create_membership_proof(leaves[2])
+    assert bytes(proofs[1]) == merkle.create_membership_proof(leaves[0])
+    assert merkle.check_membership(NULL_HASH, 3, bytes(proofs[2]))
+
+
+def test_proofs_for_index_out_of_range():
+    with pytest.raises(ValueError):
+        FixedMerkle(2, [b'a']).proofs_for([4])
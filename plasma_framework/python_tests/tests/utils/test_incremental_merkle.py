@@ -0,0 +1,34 @@
+import pytest
+
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.incremental_merkle import IncrementalMerkle
+
+
+@pytest.mark.parametrize("depth", [1, 2, 16])
+def test_empty_tree(depth):
+    assert IncrementalMerkle(depth).root == FixedMerkle(depth).root
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_root_matches_fixed_merkle_after_every_append(depth):
+    merkle = IncrementalMerkle(depth)
+    leaves = []
+    for i in range(2 ** depth):
+        leaf = i.to_bytes(2, 'big')
+        leaves.append(leaf)
+        merkle.append(leaf)
+        assert merkle.root == FixedMerkle(depth, leaves).root
+
+
+def test_initialize_with_leaves():
+    leaves = [b'a', b'b', b'c']
+    assert IncrementalMerkle(16, leaves).root == FixedMerkle(16, leaves).root
+
+
+def test_append_to_full_tree():
+    merkle = IncrementalMerkle(1, [b'a', b'b'])
+
+    with pytest.raises(ValueError) as e:
+        merkle.append(b'c')
+
+    assert str(e.value) == 'number of leaves should be at most depth ** 2'
@@ -0,0 +1,29 @@
+from plasma_core.constants import NULL_HASH
+from plasma_core.utils.merkle.batch_verifier import check_membership_batch
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+
+
+def test_check_valid_proofs():
+    leaves = [b'a', b'b', b'c', b'd', b'e']
+    merkle = FixedMerkle(16, leaves)
+    members = [(leaf, index, merkle.create_membership_proof(leaf)) for index, leaf in enumerate(leaves)]
+    members.append((NULL_HASH, len(leaves), merkle.create_membership_proof(NULL_HASH)))
+    assert check_membership_batch(members, merkle.root).tolist() == [True] * (len(leaves) + 1)
+
+
+def test_check_invalid_proofs():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(16, leaves)
+    proof = merkle.create_membership_proof(leaves[1])
+    members = [
+        (leaves[1], 1, proof),
+        (leaves[1], 0, proof),
+        (leaves[0], 1, proof),
+        (leaves[1], 1, proof[:-32]),
+        (leaves[1], 1, NULL_HASH * 16),
+    ]
+    assert check_membership_batch(members, merkle.root).tolist() == [True, False, False, False, False]
+
+
+def test_check_no_proofs():
+    assert len(check_membership_batch([], NULL_HASH)) == 0
@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from eth_keys.datatypes import Signature
+
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction, sign_many
+from tests.tests_utils.plasma_core import ACCOUNTS
+
+
+def make_transactions():
+    outputs = [(ACCOUNTS[0].address, NULL_ADDRESS, 100)]
+    return [Transaction(inputs=[(1000, i, 0), (2000, i, 1)], outputs=outputs) for i in range(3)]
+
+
+def test_sign_recovers_to_signer():
+    tx = Transaction(inputs=[(1000, 0, 0)], outputs=[(ACCOUNTS[0].address, NULL_ADDRESS, 100)])
+    tx.sign(0, ACCOUNTS[1])
+
+    signature = tx.signatures[0]
+    vrs = (signature[64] - 27, int.from_bytes(signature[:32], 'big'), int.from_bytes(signature[32:64], 'big'))
+    recovered = Signature(vrs=vrs).recover_public_key_from_msg_hash(tx.hash_struct())
+    assert recovered.to_canonical_address() == tx.signers[0] == ACCOUNTS[1].key.public_key.to_canonical_address()
+
+
+def test_sign_many_matches_sign():
+    expected = make_transactions()
+    for tx in expected:
+        tx.sign(0, ACCOUNTS[1])
+        tx.sign(1, ACCOUNTS[2])
+
+    txs = sign_many(make_transactions(), [[ACCOUNTS[1], ACCOUNTS[2]]] * 3)
+
+    assert [tx.signatures for tx in txs] == [tx.signatures for tx in expected]
+    assert [tx.signers for tx in txs] == [tx.signers for tx in expected]
+
+
+def test_sign_many_with_process_pool():
+    expected = sign_many(make_transactions(), [[ACCOUNTS[0], ACCOUNTS[1]]] * 3)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        txs = sign_many(make_transactions(), [[ACCOUNTS[0], ACCOUNTS[1]]] * 3, executor=executor)
+
+    assert [tx.signatures for tx in txs] == [tx.signatures for tx in expected]
+
+
+def test_sign_many_needs_accounts_for_every_transaction():
+    with pytest.raises(ValueError):
+        sign_many(make_transactions(), [[ACCOUNTS[0]]])
@@ -0,0 +1,32 @@
+import pytest
+from eth_tester.exceptions import TransactionFailed
+
+from tests.tests_utils.convenience_wrappers import TransactionPipeline
+
+
+def test_pipelined_transactions(w3, token, accounts):
+    owner = accounts[1]
+    pipeline = TransactionPipeline(w3)
+    pipelined_token = token.pipelined(pipeline)
+    w3.eth.disable_auto_mine()
+
+    tx_hashes = [pipelined_token.mint(owner.address, amount) for amount in range(1, 11)]
+    assert token.balanceOf(owner.address) == 0
+
+    receipts = pipeline.flush()
+
+    assert [receipt.transactionHash for receipt in receipts] == tx_hashes
+    assert token.balanceOf(owner.address) == sum(range(1, 11))
+
+
+def test_failed_pipelined_transaction_is_reported_on_flush(w3, token, accounts):
+    owner, other = accounts[1], accounts[2]
+    pipeline = TransactionPipeline(w3)
+    pipelined_token = token.pipelined(pipeline)
+    w3.eth.disable_auto_mine()
+
+    pipelined_token.mint(owner.address, 100)
+    pipelined_token.transfer(other.address, 1000, **{'from': owner.address})
+
+    with pytest.raises(TransactionFailed):
+        pipeline.flush()
@@ -0,0 +1,36 @@
+import numpy as np
+
+from plasma_core.utils.transactions import (decode_tx_id, decode_tx_ids, decode_utxo_id, decode_utxo_ids,
+                                            encode_utxo_id, encode_utxo_ids)
+
+positions = [(0, 0, 0), (1, 0, 0), (1000, 2, 3), (2 ** 32, 65535, 9999), (18000000000, 99999, 9999)]
+
+
+def test_encode_utxo_ids_matches_scalar_version():
+    blknums, txindices, oindices = (np.array(values, dtype=np.uint64) for values in zip(*positions))
+
+    utxo_ids = encode_utxo_ids(blknums, txindices, oindices)
+
+    assert utxo_ids.dtype == np.uint64
+    assert [int(utxo_id) for utxo_id in utxo_ids] == [encode_utxo_id(*position) for position in positions]
+
+
+def test_decode_utxo_ids_matches_scalar_version():
+    utxo_ids = np.array([encode_utxo_id(*position) for position in positions], dtype=np.uint64)
+
+    decoded = decode_utxo_ids(utxo_ids)
+
+    assert [tuple(int(value) for value in position) for position in zip(*decoded)] == \
+        [decode_utxo_id(int(utxo_id)) for utxo_id in utxo_ids]
+    assert all(values.dtype == np.uint64 for values in decoded)
+
+
+def test_decode_tx_ids_matches_scalar_version():
+    utxo_ids = [encode_utxo_id(*position) for position in positions]
+    assert [int(tx_id) for tx_id in decode_tx_ids(utxo_ids)] == [decode_tx_id(utxo_id) for utxo_id in utxo_ids]
+
+
+def test_round_trip():
+    rng = np.random.RandomState(0)
+    utxo_ids = encode_utxo_ids(rng.randint(0, 2 ** 33, 1000, dtype=np.int64), rng.randint(0, 10 ** 5, 1000), rng.randint(0, 10 ** 4, 1000))
+    assert np.array_equal(encode_utxo_ids(*decode_utxo_ids(utxo_ids)), utxo_ids)